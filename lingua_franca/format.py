@@ -23,6 +23,8 @@ from os.path import join
 
 
 from lingua_franca.bracket_expansion import SentenceTreeParser
+from lingua_franca.time import SECONDS_PER_DAY, SECONDS_PER_HOUR, \
+    SECONDS_PER_MINUTE
 from lingua_franca.internal import localized_function, \
     populate_localized_function_dict, get_active_langs, \
     get_full_lang_code, get_default_lang, get_default_loc, \
@@ -418,10 +420,10 @@ def nice_duration(duration, lang='', speech=True):
     # times like 2:59:59.9 instead of 3:00.
     duration += 0.5
 
-    days = int(duration // 86400)
-    hours = int(duration // 3600 % 24)
-    minutes = int(duration // 60 % 60)
-    seconds = int(duration % 60)
+    days = int(duration // SECONDS_PER_DAY)
+    hours = int(duration // SECONDS_PER_HOUR % 24)
+    minutes = int(duration // SECONDS_PER_MINUTE % 60)
+    seconds = int(duration % SECONDS_PER_MINUTE)
 
     if speech:
         out = ""
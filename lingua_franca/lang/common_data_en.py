@@ -18,7 +18,7 @@ from .parse_common import invert_dict
 
 _FUNCTION_NOT_IMPLEMENTED_WARNING = "The requested function is not implemented in English."
 
-_ARTICLES_EN = {'a', 'an', 'the'}
+_ARTICLES_EN = frozenset({'a', 'an', 'the'})
 
 
 _NUM_STRING_EN = {
@@ -247,11 +247,12 @@ _LONG_ORDINAL_EN.update(_ORDINAL_BASE_EN)
 
 
 # negate next number (-2 = 0 - 2)
-_NEGATIVES_EN = {"negative", "minus"}
+_NEGATIVES_EN = frozenset({"negative", "minus"})
 
 # sum the next number (twenty two = 20 + 2)
-_SUMS_EN = {'twenty', '20', 'thirty', '30', 'forty', '40', 'fifty', '50',
-            'sixty', '60', 'seventy', '70', 'eighty', '80', 'ninety', '90'}
+_SUMS_EN = frozenset({'twenty', '20', 'thirty', '30', 'forty', '40',
+                      'fifty', '50', 'sixty', '60', 'seventy', '70',
+                      'eighty', '80', 'ninety', '90'})
 
 
 def _generate_plurals_en(originals):
@@ -273,17 +274,17 @@ def _generate_plurals_en(originals):
     return {value + "s" for value in originals}
 
 
-_MULTIPLIES_LONG_SCALE_EN = set(_LONG_SCALE_EN.values()) | \
+_MULTIPLIES_LONG_SCALE_EN = frozenset(_LONG_SCALE_EN.values()) | \
     _generate_plurals_en(_LONG_SCALE_EN.values())
 
-_MULTIPLIES_SHORT_SCALE_EN = set(_SHORT_SCALE_EN.values()) | \
+_MULTIPLIES_SHORT_SCALE_EN = frozenset(_SHORT_SCALE_EN.values()) | \
     _generate_plurals_en(_SHORT_SCALE_EN.values())
 
 # split sentence parse separately and sum ( 2 and a half = 2 + 0.5 )
-_FRACTION_MARKER_EN = {"and"}
+_FRACTION_MARKER_EN = frozenset({"and"})
 
 # decimal marker ( 1 point 5 = 1 + 0.5)
-_DECIMAL_MARKER_EN = {"point", "dot"}
+_DECIMAL_MARKER_EN = frozenset({"point", "dot"})
 
 _STRING_NUM_EN = invert_dict(_NUM_STRING_EN)
 _STRING_NUM_EN.update(_generate_plurals_en(_STRING_NUM_EN))
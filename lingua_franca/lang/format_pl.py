@@ -19,6 +19,8 @@ from lingua_franca.lang.format_common import convert_to_mixed_fraction
 from lingua_franca.lang.common_data_pl import _NUM_STRING_PL, \
     _FRACTION_STRING_PL, _SHORT_SCALE_PL, _SHORT_ORDINAL_PL, _ALT_ORDINALS_PL
 from lingua_franca.internal import FunctionNotLocalizedError
+from lingua_franca.time import SECONDS_PER_DAY, SECONDS_PER_HOUR, \
+    SECONDS_PER_MINUTE
 
 
 def nice_number_pl(number, speech=True, denominators=range(1, 21)):
@@ -293,10 +295,10 @@ def nice_duration_pl(duration, speech=True):
     if not speech:
         raise FunctionNotLocalizedError
 
-    days = int(duration // 86400)
-    hours = int(duration // 3600 % 24)
-    minutes = int(duration // 60 % 60)
-    seconds = int(duration % 60)
+    days = int(duration // SECONDS_PER_DAY)
+    hours = int(duration // SECONDS_PER_HOUR % 24)
+    minutes = int(duration // SECONDS_PER_MINUTE % 60)
+    seconds = int(duration % SECONDS_PER_MINUTE)
 
     out = ''
     sec_main, sec_div = divmod(seconds, 10)
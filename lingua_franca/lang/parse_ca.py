@@ -28,9 +28,9 @@ from lingua_franca.lang.common_data_ca import _NUMBERS_CA, \
     _MALE_DETERMINANTS_CA, _MALE_ENDINGS_CA, _GENDERS_CA, \
     _TENS_CA, _AFTER_TENS_CA, _HUNDREDS_CA, _BEFORE_HUNDREDS_CA
 from lingua_franca.internal import resolve_resource_file
-from lingua_franca.lang.parse_common import Normalizer
+from lingua_franca.lang.parse_common import Normalizer, \
+    _PERCENT_SPLIT_RE, _HASH_SPLIT_RE
 import json
-import re
 
 
 def is_fractional_ca(input_str, short_scale=True):
@@ -173,11 +173,9 @@ def extract_number_ca(text, short_scale=True, ordinals=False):
                 count += 1
                 continue
             newWords = aWords[count + 2:]
-            newText = ""
-            for word in newWords:
-                newText += word + " "
+            newText = " ".join(newWords)
 
-            afterAndVal = extract_number_ca(newText[:-1])
+            afterAndVal = extract_number_ca(newText)
             if afterAndVal:
                 if result < afterAndVal or result < 20:
                     while afterAndVal > 1:
@@ -194,10 +192,8 @@ def extract_number_ca(text, short_scale=True, ordinals=False):
         elif next_next_word is not None:
             if next_next_word in ands:
                 newWords = aWords[count + 3:]
-                newText = ""
-                for word in newWords:
-                    newText += word + " "
-                afterAndVal = extract_number_ca(newText[:-1])
+                newText = " ".join(newWords)
+                afterAndVal = extract_number_ca(newText)
                 if afterAndVal:
                     if result is None:
                         result = 0
@@ -208,15 +204,13 @@ def extract_number_ca(text, short_scale=True, ordinals=False):
         if next_word in decimals:
             zeros = 0
             newWords = aWords[count + 2:]
-            newText = ""
-            for word in newWords:
-                newText += word + " "
+            newText = " ".join(newWords)
             for word in newWords:
                 if word == "zero" or word == "0":
                     zeros += 1
                 else:
                     break
-            afterDotVal = str(extract_number_ca(newText[:-1]))
+            afterDotVal = str(extract_number_ca(newText))
             afterDotVal = zeros * "0" + afterDotVal
             result = float(str(result) + "." + afterDotVal)
             break
@@ -242,9 +236,9 @@ class CatalanNormalizer(Normalizer):
     @staticmethod
     def tokenize(utterance):
         # Split things like 12%
-        utterance = re.sub(r"([0-9]+)([\%])", r"\1 \2", utterance)
+        utterance = _PERCENT_SPLIT_RE.sub(r"\1 \2", utterance)
         # Split things like #1
-        utterance = re.sub(r"(\#)([0-9]+\b)", r"\1 \2", utterance)
+        utterance = _HASH_SPLIT_RE.sub(r"\1 \2", utterance)
         # Don't split things like amo-te
         #utterance = re.sub(r"([a-zA-Z]+)(-)([a-zA-Z]+\b)", r"\1 \3",
         #                   utterance)
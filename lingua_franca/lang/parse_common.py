@@ -14,8 +14,61 @@
 # limitations under the License.
 #
 from collections import namedtuple
+from functools import lru_cache
 import re
 
+# Compiled once at import, these are used on every tokenize() call.
+_PERCENT_SPLIT_RE = re.compile(r"([0-9]+)([\%])")
+_HASH_SPLIT_RE = re.compile(r"(\#)([0-9]+\b)")
+_TRAILING_HYPHEN_RE = re.compile(r'- *$')
+
+
+# normalize(), extract_number() and extract_duration() all tokenize the
+# same utterances, often one right after the other, so the split is cached.
+# Callers get their own list, only the immutable words are shared.
+@lru_cache(maxsize=1024)
+def _split_words(utterance):
+    # Split things like 12%
+    utterance = _PERCENT_SPLIT_RE.sub(r"\1 \2", utterance)
+    # Split thins like #1
+    utterance = _HASH_SPLIT_RE.sub(r"\1 \2", utterance)
+    return tuple(utterance.split())
+
+
+# word sets (articles, stopwords), keyed by the tuple of their words
+_WORD_SETS = {}
+
+
+def _word_set(words):
+    """
+    Get a frozenset of the given words, for a single hash lookup per word.
+    """
+    key = tuple(words)
+    if key not in _WORD_SETS:
+        _WORD_SETS[key] = frozenset(key)
+    return _WORD_SETS[key]
+
+
+# str.translate() tables, keyed by the (char, replacement) pairs they map
+_TRANSLATION_TABLES = {}
+
+
+def _translation_table(replacements):
+    """
+    Get a str.translate() table for a {char: replacement} mapping, so all
+    the replacements happen in a single pass over the string.
+
+    Returns None if a key is longer than one character, those can only be
+    handled with str.replace().
+    """
+    key = tuple(replacements.items())
+    if key not in _TRANSLATION_TABLES:
+        if all(len(char) == 1 for char, _ in key):
+            _TRANSLATION_TABLES[key] = str.maketrans(dict(key))
+        else:
+            _TRANSLATION_TABLES[key] = None
+    return _TRANSLATION_TABLES[key]
+
 
 class Normalizer:
     """
@@ -24,17 +77,23 @@ class Normalizer:
     normalize_XX should pass a valid config read from json
     """
     _default_config = {}
+    # whether normalize() may run the word mapping steps as a single pass
+    _fuse_word_mappings = True
 
     def __init__(self, config=None):
         self.config = config or self._default_config
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # a language overriding one of these needs them run one by one
+        cls._fuse_word_mappings = all(
+            getattr(cls, name) is getattr(Normalizer, name)
+            for name in ("tokenize", "expand_contractions",
+                         "numbers_to_digits", "replace_words"))
+
     @staticmethod
     def tokenize(utterance):
-        # Split things like 12%
-        utterance = re.sub(r"([0-9]+)([\%])", r"\1 \2", utterance)
-        # Split thins like #1
-        utterance = re.sub(r"(\#)([0-9]+\b)", r"\1 \2", utterance)
-        return utterance.split()
+        return list(_split_words(utterance))
 
     @property
     def should_lowercase(self):
@@ -108,69 +167,107 @@ class Normalizer:
 
     def expand_contractions(self, utterance):
         """ Expand common contractions, e.g. "isn't" -> "is not" """
+        # a single pass over the words, each one looked up once in the dict
+        contractions = self.contractions
+        if not contractions:
+            # nothing to expand, replace_words() still tokenizes the text
+            return utterance
         words = self.tokenize(utterance)
-        for idx, w in enumerate(words):
-            if w in self.contractions:
-                words[idx] = self.contractions[w]
-        utterance = " ".join(words)
-        return utterance
+        if contractions.keys().isdisjoint(words):
+            # most utterances have no contraction, skip rebuilding them
+            return utterance
+        return " ".join([contractions.get(w, w) for w in words])
 
     def numbers_to_digits(self, utterance):
-        words = self.tokenize(utterance)
-        for idx, w in enumerate(words):
-            if w in self.number_replacements:
-                words[idx] = self.number_replacements[w]
-        utterance = " ".join(words)
-        return utterance
+        number_replacements = self.number_replacements
+        return " ".join([number_replacements.get(w, w)
+                         for w in self.tokenize(utterance)])
 
     def remove_articles(self, utterance):
-        words = self.tokenize(utterance)
-        for idx, w in enumerate(words):
-            if w in self.articles:
-                words[idx] = ""
-        utterance = " ".join(words)
-        return utterance
+        articles = self.articles
+        if not articles:
+            return utterance
+        articles = _word_set(articles)
+        return " ".join([w for w in self.tokenize(utterance)
+                         if w not in articles])
 
     def remove_stopwords(self, utterance):
         words = self.tokenize(utterance)
+        stopwords = _word_set(self.stopwords)
         for idx, w in enumerate(words):
-            if w in self.stopwords:
+            if w in stopwords:
                 words[idx] = ""
         # if words[-1] == '-':
         #    words = words[:-1]
         utterance = " ".join(words)
         # Remove trailing whitespaces from utterance along with orphaned
         # hyphens, more characters may be added later
-        utterance = re.sub(r'- *$', '', utterance)
+        utterance = _TRAILING_HYPHEN_RE.sub('', utterance)
         return utterance
 
     def remove_symbols(self, utterance):
-        for s in self.symbols:
+        symbols = self.symbols
+        table = _translation_table(dict.fromkeys(symbols, " "))
+        if table is not None:
+            return utterance.translate(table)
+        for s in symbols:
             utterance = utterance.replace(s, " ")
         return utterance
 
     def remove_accents(self, utterance):
-        for s in self.accents:
-            utterance = utterance.replace(s, self.accents[s])
+        accents = self.accents
+        table = _translation_table(accents)
+        if table is not None:
+            return utterance.translate(table)
+        for s in accents:
+            utterance = utterance.replace(s, accents[s])
         return utterance
 
     def replace_words(self, utterance):
-        words = self.tokenize(utterance)
-        for idx, w in enumerate(words):
-            if w in self.word_replacements:
-                words[idx] = self.word_replacements[w]
-        utterance = " ".join(words)
-        return utterance
+        word_replacements = self.word_replacements
+        return " ".join([word_replacements.get(w, w)
+                         for w in self.tokenize(utterance)])
+
+    def map_words(self, utterance):
+        """
+        Expand contractions, replace numbers and replace words in a single
+        pass over the words, with the same result as calling
+        expand_contractions(), numbers_to_digits() and replace_words() in
+        turn.
+        """
+        mappings = []
+        if self.should_expand_contractions:
+            mappings.append(self.contractions)
+        if self.should_numbers_to_digits:
+            mappings.append(self.number_replacements)
+        mappings.append(self.word_replacements)
+        mappings = [mapping for mapping in mappings if mapping]
+        words = []
+        for word in self.tokenize(utterance):
+            parts = [word]
+            for mapping in mappings:
+                if len(parts) == 1:
+                    if parts[0] in mapping:
+                        parts = self.tokenize(mapping[parts[0]])
+                else:
+                    # a replacement made several words, map each of them
+                    parts = self.tokenize(
+                        " ".join([mapping.get(w, w) for w in parts]))
+            words.extend(parts)
+        return " ".join(words)
 
     def normalize(self, utterance="", remove_articles=None):
         # mutations
         if self.should_lowercase:
             utterance = utterance.lower()
-        if self.should_expand_contractions:
-            utterance = self.expand_contractions(utterance)
-        if self.should_numbers_to_digits:
-            utterance = self.numbers_to_digits(utterance)
-        utterance = self.replace_words(utterance)
+        if self._fuse_word_mappings:
+            utterance = self.map_words(utterance)
+        else:
+            if self.should_expand_contractions:
+                utterance = self.expand_contractions(utterance)
+            if self.should_numbers_to_digits:
+                utterance = self.numbers_to_digits(utterance)
+            utterance = self.replace_words(utterance)
 
         # removals
         if self.should_remove_symbols:
@@ -184,8 +281,9 @@ class Normalizer:
             utterance = self.remove_articles(utterance)
         if self.should_remove_stopwords:
             utterance = self.remove_stopwords(utterance)
-        # remove extra spaces
-        utterance = " ".join([w for w in utterance.split(" ") if w])
+        # remove extra spaces, replace_words() has already turned any other
+        # whitespace into single spaces
+        utterance = " ".join(utterance.split())
         return utterance
 
 
@@ -241,6 +339,12 @@ class ReplaceableNumber:
                                       t=self.tokens)
 
 
+@lru_cache(maxsize=1024)
+def _tokenize(text):
+    return tuple(Token(word, index)
+                 for index, word in enumerate(_split_words(text)))
+
+
 def tokenize(text):
     """
     Generate a list of token object, given a string.
@@ -251,8 +355,7 @@ def tokenize(text):
         [Token]
 
     """
-    return [Token(word, index)
-            for index, word in enumerate(Normalizer.tokenize(text))]
+    return list(_tokenize(text))
 
 
 def partition_list(items, split_on):
@@ -282,7 +385,7 @@ def partition_list(items, split_on):
         else:
             current_split.append(item)
     splits.append(current_split)
-    return list(filter(lambda x: len(x) != 0, splits))
+    return [split for split in splits if split]
 
 
 def invert_dict(original):
@@ -29,6 +29,14 @@ import json
 from lingua_franca import resolve_resource_file
 from lingua_franca.time import now_local
 
+# Duration patterns, compiled once at import.
+_DURATION_UNIT_PATTERNS_CS = {
+    unit_cs: re.compile(
+        r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[ay]?".format(
+            unit=unit_cs))
+    for unit_cs in _TIME_UNITS_CONVERSION
+}
+
 
 def generate_plurals_cs(originals):
     """
@@ -641,16 +649,15 @@ def extract_duration_cs(text):
         'weeks': 0
     }
 
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[ay]?"
     text = _convert_words_to_numbers_cs(text)
 
     for (unit_cs, unit_en) in _TIME_UNITS_CONVERSION.items():
-        unit_pattern = pattern.format(unit=unit_cs)
+        unit_pattern = _DURATION_UNIT_PATTERNS_CS[unit_cs]
 
         def repl(match):
             time_units[unit_en] += float(match.group(1))
             return ''
-        text = re.sub(unit_pattern, repl, text)
+        text = unit_pattern.sub(repl, text)
 
     text = text.strip()
     duration = timedelta(**time_units) if any(time_units.values()) else None
@@ -854,7 +854,7 @@ def normalize_da(text, remove_articles=True):
     """ German string normalization """
 
     words = text.split()  # this also removed extra spaces
-    normalized = ""
+    normalized = []
     for word in words:
         if remove_articles and word in ["den", "det"]:
             continue
@@ -864,9 +864,9 @@ def normalize_da(text, remove_articles=True):
         if word in _DA_NUMBERS:
             word = str(_DA_NUMBERS[word])
 
-        normalized += " " + word
+        normalized.append(word)
 
-    return normalized[1:]  # strip the initial space
+    return " ".join(normalized)
 
 
 def extract_numbers_da(text, short_scale=True, ordinals=False):
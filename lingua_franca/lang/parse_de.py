@@ -22,6 +22,15 @@ from lingua_franca.lang.common_data_de import _DE_NUMBERS
 from lingua_franca.lang.format_de import pronounce_number_de
 from lingua_franca.time import now_local
 
+# Duration patterns (singular and plural), compiled once at import.
+_DURATION_UNIT_PATTERNS_DE = {
+    unit_de: re.compile(
+        r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[ne]?".format(
+            unit=unit_de[:-1]))  # remove 'n'/'e' from unit
+    for unit_de in ('mikrosekunden', 'millisekunden', 'sekunden', 'minuten',
+                    'stunden', 'tage', 'wochen')
+}
+
 
 de_numbers = {
     'null': 0,
@@ -121,21 +130,17 @@ def extract_duration_de(text):
         'weeks': 'wochen'
     }
 
-    # Einzahl und Mehrzahl
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[ne]?"
-
     # TODO Einstiegspunkt für Text-zu-Zahlen Konversion
     #text = _convert_words_to_numbers_de(text)
 
     for (unit_en, unit_de) in time_units.items():
-        unit_pattern = pattern.format(
-            unit=unit_de[:-1])  # remove 'n'/'e' from unit
+        unit_pattern = _DURATION_UNIT_PATTERNS_DE[unit_de]
         time_units[unit_en] = 0
 
         def repl(match):
             time_units[unit_en] += float(match.group(1))
             return ''
-        text = re.sub(unit_pattern, repl, text)
+        text = unit_pattern.sub(repl, text)
 
     text = text.strip()
     duration = timedelta(**time_units) if any(time_units.values()) else None
@@ -981,7 +986,7 @@ def normalize_de(text, remove_articles=True):
     """ German string normalization """
     # TODO return GermanNormalizer().normalize(text, remove_articles)
     words = text.split()  # this also removed extra spaces
-    normalized = ""
+    normalized = []
     for word in words:
         if remove_articles and word in ["der", "die", "das", "des", "den",
                                         "dem"]:
@@ -998,9 +1003,9 @@ def normalize_de(text, remove_articles=True):
         if word in _DE_NUMBERS:
             word = str(_DE_NUMBERS[word])
 
-        normalized += " " + word
+        normalized.append(word)
 
-    return normalized[1:]  # strip the initial space
+    return " ".join(normalized)
 
 
 def extract_numbers_de(text, short_scale=True, ordinals=False):
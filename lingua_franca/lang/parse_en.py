@@ -31,6 +31,20 @@ import re
 import json
 from lingua_franca.internal import resolve_resource_file
 
+_ARTICLES_AND_NEGATIVES_EN = _ARTICLES_EN | _NEGATIVES_EN
+
+# explicit ordinals, 1st, 2nd, 3rd, 4th.... Nth
+_ORDINAL_SUFFIXES_EN = ("rd", "st", "nd", "th")
+
+# Duration patterns, one per timedelta keyword, compiled once at import.
+_DURATION_UNITS_EN = ('microseconds', 'milliseconds', 'seconds', 'minutes',
+                      'hours', 'days', 'weeks')
+_DURATION_UNIT_PATTERNS_EN = {
+    unit: re.compile(r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}s?".format(
+        unit=unit[:-1]))  # remove 's' from unit
+    for unit in _DURATION_UNITS_EN
+}
+
 
 def _convert_words_to_numbers_en(text, short_scale=True, ordinals=False):
     """
@@ -47,6 +61,9 @@ def _convert_words_to_numbers_en(text, short_scale=True, ordinals=False):
 
     """
     tokens = tokenize(text)
+    if not _has_number_hint_en(text):
+        # one scan for digits and number words, nothing to convert
+        return ' '.join(token.word for token in tokens)
     numbers_to_replace = \
         _extract_numbers_with_text_en(tokens, short_scale, ordinals)
     numbers_to_replace.sort(key=lambda number: number.start_index)
@@ -184,7 +201,11 @@ def _extract_fraction_with_text_en(tokens, short_scale, ordinals):
         (None, None) if no fraction value is found.
 
     """
+    words = [t.word for t in tokens]
     for c in _FRACTION_MARKER_EN:
+        if c not in words:
+            # nothing to partition on, spare the per token callback
+            continue
         partitions = partition_list(tokens, lambda t: t.word == c)
 
         if len(partitions) == 3:
@@ -232,7 +253,11 @@ def _extract_decimal_with_text_en(tokens, short_scale, ordinals):
         (None, None) if no decimal value is found.
 
     """
+    words = [t.word for t in tokens]
     for c in _DECIMAL_MARKER_EN:
+        if c not in words:
+            # nothing to partition on, spare the per token callback
+            continue
         partitions = partition_list(tokens, lambda t: t.word == c)
 
         if len(partitions) == 3:
@@ -275,29 +300,35 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
     """
     multiplies, string_num_ordinal, string_num_scale = \
         _initialize_number_data_en(short_scale, speech=ordinals is not None)
+    number_words_en = _NUMBER_WORDS_EN[bool(short_scale), bool(ordinals),
+                                       ordinals is not None]
+    number_values_en = _NUMBER_VALUES_EN[bool(short_scale), bool(ordinals),
+                                         ordinals is not None]
 
     number_words = []  # type: [Token]
     val = False
     prev_val = None
     next_val = None
-    to_sum = []
+    # running total of the completed "places", None until there is one
+    to_sum = None
+    # lowercase every word once, they are looked at up to four times each
+    words = [token.word.lower() for token in tokens]
     for idx, token in enumerate(tokens):
         current_val = None
         if next_val:
             next_val = None
             continue
 
-        word = token.word.lower()
+        word = words[idx]
         if word in _ARTICLES_EN or word in _NEGATIVES_EN:
             number_words.append(token)
             continue
 
-        prev_word = tokens[idx - 1].word.lower() if idx > 0 else ""
-        next_word = tokens[idx + 1].word.lower() if idx + 1 < len(tokens) else ""
+        prev_word = words[idx - 1] if idx > 0 else ""
+        next_word = words[idx + 1] if idx + 1 < len(words) else ""
 
-        if is_numeric(word[:-2]) and \
-                (word.endswith("st") or word.endswith("nd") or
-                 word.endswith("rd") or word.endswith("th")):
+        # check the suffix first, is_numeric() is costly on non-numbers
+        if word.endswith(_ORDINAL_SUFFIXES_EN) and is_numeric(word[:-2]):
 
             # explicit ordinals, 1st, 2nd, 3rd, 4th.... Nth
             word = word[:-2]
@@ -306,22 +337,16 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
             if next_word == "one":
                 # would return 1 instead otherwise
                 tokens[idx + 1] = Token("", idx)
-                next_word = ""
-
-        # TODO replaces the wall of "and" and "or" with all() or any() as
-        #  appropriate, the whole codebase should be checked for this pattern
-        if word not in string_num_scale and \
-                word not in _STRING_NUM_EN and \
-                word not in _SUMS_EN and \
-                word not in multiplies and \
-                not (ordinals and word in string_num_ordinal) and \
-                not is_numeric(word) and \
-                not is_fractional_en(word, short_scale=short_scale) and \
-                not look_for_fractions(word.split('/')):
-            words_only = [token.word for token in number_words]
+                words[idx + 1] = next_word = ""
 
-            if number_words and not all([w.lower() in _ARTICLES_EN |
-                                         _NEGATIVES_EN for w in words_only]):
+        # every word is float()-parsed at most once
+        numeric = is_numeric(word)
+        if word not in number_words_en and \
+                not numeric and \
+                not look_for_fractions(word.split('/')):
+            if number_words and not all(t.word.lower() in
+                                        _ARTICLES_AND_NEGATIVES_EN
+                                        for t in number_words):
                 break
             else:
                 number_words = []
@@ -344,7 +369,7 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
             number_words.append(token)
 
         # is this word already a number ?
-        if is_numeric(word):
+        if numeric:
             if word.isdigit():  # doesn't work with decimals
                 val = int(word)
             else:
@@ -352,14 +377,8 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
             current_val = val
 
         # is this word the name of a number ?
-        if word in _STRING_NUM_EN:
-            val = _STRING_NUM_EN.get(word)
-            current_val = val
-        elif word in string_num_scale:
-            val = string_num_scale.get(word)
-            current_val = val
-        elif ordinals and word in string_num_ordinal:
-            val = string_num_ordinal[word]
+        if word in number_values_en:
+            val = number_values_en[word]
             current_val = val
 
         # is the prev word an ordinal number and current word is one?
@@ -369,9 +388,8 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
 
         # is the prev word a number and should we sum it?
         # twenty two, fifty six
-        if (prev_word in _SUMS_EN and val and val < 10) or all([prev_word in
-                                                                multiplies,
-                                                                val < prev_val if prev_val else False]):
+        if (prev_word in _SUMS_EN and val and val < 10) or \
+                (prev_word in multiplies and prev_val and val < prev_val):
             val = prev_val + val
 
         # is the prev word a number and should we multiply it?
@@ -412,11 +430,10 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
                 current_val = val
 
         else:
-            if current_val and all([
-                prev_word in _SUMS_EN,
-                word not in _SUMS_EN,
-                    word not in multiplies,
-                    current_val >= 10]):
+            if current_val and prev_word in _SUMS_EN and \
+                    word not in _SUMS_EN and \
+                    word not in multiplies and \
+                    current_val >= 10:
                 # Backtrack - we've got numbers we can't sum.
                 number_words.pop()
                 val = prev_val
@@ -459,19 +476,19 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
                 # value is larger than all remaining powers of ten.
                 #
                 # The if statement passes, and nine million (9000000)
-                # is appended to `to_sum`.
+                # is added to `to_sum`.
                 #
                 # The main variables are reset, and the main loop begins
-                # assembling another number, which will also be appended
+                # assembling another number, which will also be added
                 # under the same conditions.
                 #
-                # By the end of the main loop, to_sum will be a list of each
-                # "place" from 100 up: [9000000, 907000, 600]
+                # By the end of the main loop, to_sum will be the total of each
+                # "place" from 100 up: 9000000 + 907000 + 600
                 #
-                # The final three digits will be added to the sum of that list
-                # at the end of the main loop, to produce the extracted number:
+                # The final three digits will be added to that total at the
+                # end of the main loop, to produce the extracted number:
                 #
-                #    sum([9000000, 907000, 600]) + 57
+                #    (9000000 + 907000 + 600) + 57
                 # == 9,000,000 + 907,000 + 600 + 57
                 # == 9,907,657
                 #
@@ -481,30 +498,31 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
                 # 9907657
 
                 time_to_sum = True
-                for other_token in tokens[idx+1:]:
-                    if other_token.word.lower() in multiplies:
-                        if string_num_scale[other_token.word.lower()] >= current_val:
+                for other_word in words[idx+1:]:
+                    if other_word in multiplies:
+                        if string_num_scale[other_word] >= current_val:
                             time_to_sum = False
                         else:
                             continue
                     if not time_to_sum:
                         break
                 if time_to_sum:
-                    to_sum.append(val)
+                    to_sum = val if to_sum is None else to_sum + val
                     val = 0
                     prev_val = 0
 
-    if val is not None and to_sum:
-        val += sum(to_sum)
+    if val is not None and to_sum is not None:
+        val += to_sum
 
     return val, number_words
 
 
 def _initialize_number_data_en(short_scale, speech=True):
     """
-    Generate dictionaries of words to numbers, based on scale.
+    Get dictionaries of words to numbers, based on scale.
 
-    This is a helper function for _extract_whole_number.
+    This is a helper function for _extract_whole_number. The dictionaries
+    are built once, at import, and must not be modified.
 
     Args:
         short_scale (bool):
@@ -515,6 +533,10 @@ def _initialize_number_data_en(short_scale, speech=True):
         multiplies, string_num_ordinal, string_num_scale
 
     """
+    return _NUMBER_DATA_EN[bool(short_scale), bool(speech)]
+
+
+def _build_number_data_en(short_scale, speech):
     multiplies = _MULTIPLIES_SHORT_SCALE_EN if short_scale \
         else _MULTIPLIES_LONG_SCALE_EN
 
@@ -530,6 +552,83 @@ def _initialize_number_data_en(short_scale, speech=True):
     return multiplies, string_num_ordinal_en, string_num_scale_en
 
 
+def _build_fractions_en(ordinal_words):
+    fracts = {"whole": 1, "half": 2, "halve": 2, "quarter": 4}
+    for num in ordinal_words:
+        if num > 2:
+            fracts[ordinal_words[num]] = num
+    return fracts
+
+
+def _build_number_words_en(short_scale, ordinals, speech):
+    """
+    Collect every word which can be part of a spoken number, so that
+    _extract_whole_number_with_text_en can classify a token with a single
+    set lookup. Digits and "2/3" style fractions are checked separately.
+    """
+    multiplies, string_num_ordinal, string_num_scale = \
+        _NUMBER_DATA_EN[short_scale, speech]
+    fractions = _FRACTIONS_EN[short_scale]
+    words = set(string_num_scale) | set(_STRING_NUM_EN) | _SUMS_EN | \
+        multiplies | set(fractions) | {f + "s" for f in fractions}
+    if ordinals:
+        words |= set(string_num_ordinal)
+    return frozenset(words)
+
+
+_NUMBER_DATA_EN = {(short_scale, speech):
+                   _build_number_data_en(short_scale, speech)
+                   for short_scale in (True, False)
+                   for speech in (True, False)}
+
+_FRACTIONS_EN = {True: _build_fractions_en(_SHORT_ORDINAL_EN),
+                 False: _build_fractions_en(_LONG_ORDINAL_EN)}
+
+# keyed by (short_scale, ordinals, speech)
+_NUMBER_WORDS_EN = {(short_scale, ordinals, speech):
+                    _build_number_words_en(short_scale, ordinals, speech)
+                    for short_scale in (True, False)
+                    for ordinals in (True, False)
+                    for speech in (True, False)}
+
+_ALL_NUMBER_WORDS_EN = frozenset().union(*_NUMBER_WORDS_EN.values())
+
+
+def _build_number_values_en(short_scale, ordinals, speech):
+    """
+    Map every word naming a whole number to its value, so that
+    _extract_whole_number_with_text_en needs a single dict lookup. Where
+    tables overlap, plain numbers win over scales, and scales over ordinals.
+    """
+    _, string_num_ordinal, string_num_scale = \
+        _NUMBER_DATA_EN[short_scale, speech]
+    values = dict(string_num_ordinal) if ordinals else {}
+    values.update(string_num_scale)
+    values.update(_STRING_NUM_EN)
+    return values
+
+
+# keyed by (short_scale, ordinals, speech), like _NUMBER_WORDS_EN
+_NUMBER_VALUES_EN = {(short_scale, ordinals, speech):
+                     _build_number_values_en(short_scale, ordinals, speech)
+                     for short_scale in (True, False)
+                     for ordinals in (True, False)
+                     for speech in (True, False)}
+
+# float() also parses "inf" and "nan", see is_numeric()
+_NUMBER_HINT_RE = re.compile(r"\d|inf|nan", re.IGNORECASE)
+
+
+def _has_number_hint_en(text):
+    """
+    Cheap check for anything the number parser could possibly pick up:
+    a digit, something float() accepts or a number word. If this returns
+    False, no number will be found in text.
+    """
+    return bool(_NUMBER_HINT_RE.search(text)) or \
+        not _ALL_NUMBER_WORDS_EN.isdisjoint(text.lower().split())
+
+
 def extract_number_en(text, short_scale=True, ordinals=False):
     """
     This function extracts a number from a text string,
@@ -546,6 +645,8 @@ def extract_number_en(text, short_scale=True, ordinals=False):
                                    was found
 
     """
+    if not _has_number_hint_en(text):
+        return False
     return _extract_number_with_text_en(tokenize(text.lower()),
                                         short_scale, ordinals).value
 
@@ -578,34 +679,85 @@ def extract_duration_en(text):
     """
     if not text:
         return None
+    if not _has_number_hint_en(text):
+        # nothing to convert, keep the whitespace handling of the slow path
+        return (None, " ".join(t.word for t in tokenize(text)))
+
+    # amount of each of _DURATION_UNITS_EN, in the same order
+    amounts = [0] * len(_DURATION_UNITS_EN)
 
-    time_units = {
-        'microseconds': 0,
-        'milliseconds': 0,
-        'seconds': 0,
-        'minutes': 0,
-        'hours': 0,
-        'days': 0,
-        'weeks': 0
-    }
-
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}s?"
     text = _convert_words_to_numbers_en(text)
 
-    for unit_en in time_units:
-        unit_pattern = pattern.format(unit=unit_en[:-1])   # remove 's' from unit
+    for idx, unit_en in enumerate(_DURATION_UNITS_EN):
+        unit_pattern = _DURATION_UNIT_PATTERNS_EN[unit_en]
 
         def repl(match):
-            time_units[unit_en] += float(match.group(1))
+            amounts[idx] += float(match.group(1))
             return ''
-        text = re.sub(unit_pattern, repl, text)
+        text = unit_pattern.sub(repl, text)
 
     text = text.strip()
-    duration = timedelta(**time_units) if any(time_units.values()) else None
+    if any(amounts):
+        duration = timedelta(**dict(zip(_DURATION_UNITS_EN, amounts)))
+    else:
+        duration = None
 
     return (duration, text)
 
 
+# Vocabulary of extract_datetime_en(), built once at import. The word lists
+# whose positions matter are tuples, the rest are only tested for membership.
+_TIME_QUALIFIERS_AM_EN = frozenset(['morning'])
+_TIME_QUALIFIERS_PM_EN = frozenset(['afternoon', 'evening', 'night',
+                                    'tonight'])
+_TIME_QUALIFIERS_EN = _TIME_QUALIFIERS_AM_EN | _TIME_QUALIFIERS_PM_EN
+_DATE_MARKERS_EN = frozenset(['at', 'in', 'on', 'by', 'this', 'around', 'for',
+                              'of', "within"])
+_WEEKDAYS_EN = ('monday', 'tuesday', 'wednesday',
+                'thursday', 'friday', 'saturday', 'sunday')
+_MONTHS_EN = ('january', 'february', 'march', 'april', 'may', 'june',
+              'july', 'august', 'september', 'october', 'november',
+              'december')
+_RECUR_MARKERS_EN = frozenset(_WEEKDAYS_EN +
+                              tuple(d + 's' for d in _WEEKDAYS_EN) +
+                              ('weekend', 'weekday', 'weekends', 'weekdays'))
+_MONTHS_SHORT_EN = ('jan', 'feb', 'mar', 'apr', 'may', 'june', 'july', 'aug',
+                    'sept', 'oct', 'nov', 'dec')
+_MONTH_WORDS_EN = frozenset(_MONTHS_EN)
+_MONTH_SHORT_WORDS_EN = frozenset(_MONTHS_SHORT_EN)
+# weekday name -> 0 (monday) to 6 (sunday)
+_WEEKDAY_NUMBERS_EN = {day: idx for idx, day in enumerate(_WEEKDAYS_EN)}
+# full or short month name -> full month name
+_MONTH_NAMES_EN = dict(zip(_MONTHS_SHORT_EN, _MONTHS_EN))
+_MONTH_NAMES_EN.update(zip(_MONTHS_EN, _MONTHS_EN))
+# default hour for a part of the day, if no time is given
+_DAYTIME_HOURS_EN = {'morning': 8, 'afternoon': 15, 'evening': 19}
+_YEAR_MULTIPLES_EN = frozenset(["decade", "century", "millennium"])
+_DAY_MULTIPLES_EN = frozenset(["weeks", "months", "years"])
+# punctuation removed from utterances before looking for dates, in one pass
+_DATETIME_PUNCTUATION_EN = str.maketrans('', '', '?.,')
+# words that can follow "from" or "after" in "5 days from tomorrow"
+_DATE_FOLLOWUPS_EN = frozenset(_WEEKDAYS_EN + _MONTHS_EN + _MONTHS_SHORT_EN +
+                               ("today", "tomorrow", "yesterday", "next",
+                                "last", "now", "this"))
+
+# Every date or time extract_datetime_en() finds involves a number or one of
+# these (as part of a word, so plurals and weekdays are covered by "day").
+_DATETIME_HINT_RE_EN = re.compile(
+    r"day|week|month|year|decade|centur|millenni|hour|minute|second|"
+    r"now|night|noon|morning|evening|tomorrow|from|after|couple|clock|"
+    r"jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec", re.IGNORECASE)
+
+
+def _has_datetime_hint_en(text):
+    """
+    Cheap check for anything extract_datetime_en() could pick up. If this
+    returns False, no date or time will be found in text.
+    """
+    return bool(_DATETIME_HINT_RE_EN.search(text)) or \
+        _has_number_hint_en(text)
+
+
 def extract_datetime_en(text, anchorDate=None, default_time=None):
     """ Convert a human date reference into an exact datetime
 
@@ -641,7 +793,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
         # normalize and lowercase utt  (replaces words with numbers)
         s = _convert_words_to_numbers_en(s, ordinals=None)
         # clean unneeded punctuation and capitalization among other things.
-        s = s.lower().replace('?', '').replace('.', '').replace(',', '') \
+        s = s.lower().translate(_DATETIME_PUNCTUATION_EN) \
             .replace(' the ', ' ').replace(' a ', ' ').replace(' an ', ' ') \
             .replace("o' clock", "o'clock").replace("o clock", "o'clock") \
             .replace("o ' clock", "o'clock").replace("o 'clock", "o'clock") \
@@ -653,9 +805,8 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
         for idx, word in enumerate(wordList):
             word = word.replace("'s", "")
 
-            ordinals = ["rd", "st", "nd", "th"]
             if word[0].isdigit():
-                for ordinal in ordinals:
+                for ordinal in _ORDINAL_SUFFIXES_EN:
                     # "second" is the only case we should not do this
                     if ordinal in word and "second" not in word:
                         word = word.replace(ordinal, "")
@@ -673,12 +824,12 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 minAbs or secOffset != 0
             )
 
+    if text == "" or not _has_datetime_hint_en(text):
+        return None
+
     if not anchorDate:
         anchorDate = now_local()
 
-    if text == "":
-        return None
-
     found = False
     daySpecified = False
     dayOffset = False
@@ -691,21 +842,15 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
     hasYear = False
     timeQualifier = ""
 
-    timeQualifiersAM = ['morning']
-    timeQualifiersPM = ['afternoon', 'evening', 'night', 'tonight']
-    timeQualifiersList = set(timeQualifiersAM + timeQualifiersPM)
-    markers = ['at', 'in', 'on', 'by', 'this', 'around', 'for', 'of', "within"]
-    days = ['monday', 'tuesday', 'wednesday',
-            'thursday', 'friday', 'saturday', 'sunday']
-    months = ['january', 'february', 'march', 'april', 'may', 'june',
-              'july', 'august', 'september', 'october', 'november',
-              'december']
-    recur_markers = days + [d + 's' for d in days] + ['weekend', 'weekday',
-                                                      'weekends', 'weekdays']
-    monthsShort = ['jan', 'feb', 'mar', 'apr', 'may', 'june', 'july', 'aug',
-                   'sept', 'oct', 'nov', 'dec']
-    year_multiples = ["decade", "century", "millennium"]
-    day_multiples = ["weeks", "months", "years"]
+    timeQualifiersAM = _TIME_QUALIFIERS_AM_EN
+    timeQualifiersPM = _TIME_QUALIFIERS_PM_EN
+    timeQualifiersList = _TIME_QUALIFIERS_EN
+    markers = _DATE_MARKERS_EN
+    months = _MONTH_WORDS_EN
+    recur_markers = _RECUR_MARKERS_EN
+    monthsShort = _MONTH_SHORT_WORDS_EN
+    year_multiples = _YEAR_MULTIPLES_EN
+    day_multiples = _DAY_MULTIPLES_EN
 
     words = clean_string(text)
 
@@ -841,8 +986,8 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 used = 2
         # parse Monday, Tuesday, etc., and next Monday,
         # last Tuesday, etc.
-        elif word in days and not fromFlag:
-            d = days.index(word)
+        elif word in _WEEKDAY_NUMBERS_EN and not fromFlag:
+            d = _WEEKDAY_NUMBERS_EN[word]
             dayOffset = (d + 1) - int(today)
             used = 1
             if dayOffset < 0:
@@ -858,12 +1003,8 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 start -= 1
                 # parse 15 of July, June 20th, Feb 18, 19 of February
         elif word in months or word in monthsShort and not fromFlag:
-            try:
-                m = months.index(word)
-            except ValueError:
-                m = monthsShort.index(word)
             used += 1
-            datestr = months[m]
+            datestr = _MONTH_NAMES_EN[word]
             if wordPrev and (wordPrev[0].isdigit() or
                              (wordPrev == "of" and wordPrevPrev[0].isdigit())):
                 if wordPrev == "of" and wordPrevPrev[0].isdigit():
@@ -894,35 +1035,28 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
             # if no date indicators found, it may not be the month of May
             # may "i/we" ...
             # "... may be"
-            elif word == 'may' and wordNext in ['i', 'we', 'be']:
+            elif word == 'may' and wordNext in {'i', 'we', 'be'}:
                 datestr = ""
 
         # parse 5 days from tomorrow, 10 weeks from next thursday,
         # 2 months from July
-        validFollowups = days + months + monthsShort
-        validFollowups.append("today")
-        validFollowups.append("tomorrow")
-        validFollowups.append("yesterday")
-        validFollowups.append("next")
-        validFollowups.append("last")
-        validFollowups.append("now")
-        validFollowups.append("this")
-        if (word == "from" or word == "after") and wordNext in validFollowups:
+        if (word == "from" or word == "after") and \
+                wordNext in _DATE_FOLLOWUPS_EN:
             used = 2
             fromFlag = True
             if wordNext == "tomorrow":
                 dayOffset += 1
             elif wordNext == "yesterday":
                 dayOffset -= 1
-            elif wordNext in days:
-                d = days.index(wordNext)
+            elif wordNext in _WEEKDAY_NUMBERS_EN:
+                d = _WEEKDAY_NUMBERS_EN[wordNext]
                 tmpOffset = (d + 1) - int(today)
                 used = 2
                 if tmpOffset < 0:
                     tmpOffset += 7
                 dayOffset += tmpOffset
-            elif wordNextNext and wordNextNext in days:
-                d = days.index(wordNextNext)
+            elif wordNextNext in _WEEKDAY_NUMBERS_EN:
+                d = _WEEKDAY_NUMBERS_EN[wordNextNext]
                 tmpOffset = (d + 1) - int(today)
                 used = 3
                 if wordNext == "next":
@@ -972,17 +1106,9 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
         elif word == "midnight":
             hrAbs = 0
             used += 1
-        elif word == "morning":
+        elif word in _DAYTIME_HOURS_EN:
             if hrAbs is None:
-                hrAbs = 8
-            used += 1
-        elif word == "afternoon":
-            if hrAbs is None:
-                hrAbs = 15
-            used += 1
-        elif word == "evening":
-            if hrAbs is None:
-                hrAbs = 19
+                hrAbs = _DAYTIME_HOURS_EN[word]
             used += 1
         elif word == "tonight" or word == "night":
             if hrAbs is None:
@@ -991,7 +1117,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
 
         # couple of time_unit
         elif word == "2" and wordNext == "of" and \
-                wordNextNext in ["hours", "minutes", "seconds"]:
+                wordNextNext in {"hours", "minutes", "seconds"}:
             used += 3
             if wordNextNext == "hours":
                 hrOffset = 2
@@ -1286,9 +1412,9 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
             HH = HH - 12 if remainder == "am" and HH >= 12 else HH
 
             if (not military and
-                    remainder not in ['am', 'pm', 'hours', 'minutes',
+                    remainder not in {'am', 'pm', 'hours', 'minutes',
                                       "second", "seconds",
-                                      "hour", "minute"] and
+                                      "hour", "minute"} and
                     ((not daySpecified) or 0 <= dayOffset < 1)):
 
                 # ambiguous time, detect whether they mean this evening or
@@ -1438,16 +1564,7 @@ def is_fractional_en(input_str, short_scale=True, spoken=True):
     if input_str.endswith('s', -1):
         input_str = input_str[:len(input_str) - 1]  # e.g. "fifths"
 
-    fracts = {"whole": 1, "half": 2, "halve": 2, "quarter": 4}
-    if short_scale:
-        for num in _SHORT_ORDINAL_EN:
-            if num > 2:
-                fracts[_SHORT_ORDINAL_EN[num]] = num
-    else:
-        for num in _LONG_ORDINAL_EN:
-            if num > 2:
-                fracts[_LONG_ORDINAL_EN[num]] = num
-
+    fracts = _FRACTIONS_EN[bool(short_scale)]
     if input_str.lower() in fracts and spoken:
         return 1.0 / fracts[input_str.lower()]
     return False
@@ -1467,6 +1584,8 @@ def extract_numbers_en(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
+    if not _has_number_hint_en(text):
+        return []
     results = _extract_numbers_with_text_en(tokenize(text),
                                             short_scale, ordinals)
     return [float(result.value) for result in results]
@@ -128,11 +128,9 @@ def extract_number_es(text, short_scale=True, ordinals=False):
                 count += 1
                 continue
             newWords = aWords[count + 2:]
-            newText = ""
-            for word in newWords:
-                newText += word + " "
+            newText = " ".join(newWords)
 
-            afterAndVal = extract_number_es(newText[:-1])
+            afterAndVal = extract_number_es(newText)
             if afterAndVal:
                 if result < afterAndVal or result < 20:
                     while afterAndVal > 1:
@@ -149,10 +147,8 @@ def extract_number_es(text, short_scale=True, ordinals=False):
         elif next_next_word is not None:
             if next_next_word in ands:
                 newWords = aWords[count + 3:]
-                newText = ""
-                for word in newWords:
-                    newText += word + " "
-                afterAndVal = extract_number_es(newText[:-1])
+                newText = " ".join(newWords)
+                afterAndVal = extract_number_es(newText)
                 if afterAndVal:
                     if result is None:
                         result = 0
@@ -163,15 +159,13 @@ def extract_number_es(text, short_scale=True, ordinals=False):
         if next_word in decimals:
             zeros = 0
             newWords = aWords[count + 2:]
-            newText = ""
-            for word in newWords:
-                newText += word + " "
+            newText = " ".join(newWords)
             for word in newWords:
                 if word == "cero" or word == "0":
                     zeros += 1
                 else:
                     break
-            afterDotVal = str(extract_number_es(newText[:-1]))
+            afterDotVal = str(extract_number_es(newText))
             afterDotVal = zeros * "0" + afterDotVal
             result = float(str(result) + "." + afterDotVal)
             break
@@ -292,7 +286,7 @@ def normalize_es(text, remove_articles=True):
     # TODO return SpanishNormalizer().normalize(text, remove_articles)
     words = text.split()  # this also removed extra spaces
 
-    normalized = ""
+    normalized = []
     i = 0
     while i < len(words):
         word = words[i]
@@ -305,13 +299,13 @@ def normalize_es(text, remove_articles=True):
         r = _es_number_parse(words, i)
         if r:
             v, i = r
-            normalized += " " + str(v)
+            normalized.append(str(v))
             continue
 
-        normalized += " " + word
+        normalized.append(word)
         i += 1
 
-    return normalized[1:]  # strip the initial space
+    return " ".join(normalized)
 
 
 # TODO MycroftAI/mycroft-core#2348
@@ -24,6 +24,15 @@ from lingua_franca.lang.common_data_fr import _ARTICLES_FR, _NUMBERS_FR, \
     _ORDINAL_ENDINGS_FR
 from lingua_franca.time import now_local
 
+# Duration patterns, compiled once at import.
+_DURATION_UNIT_PATTERNS_FR = {
+    unit_fr: re.compile(
+        r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[s]?(\s+|,|$)".format(
+            unit=unit_fr[:-1]))  # remove 's' from unit
+    for unit_fr in ('microsecondes', 'millisecondes', 'secondes', 'minutes',
+                    'heures', 'jours', 'semaines')
+}
+
 
 def extract_duration_fr(text):
     """
@@ -60,16 +69,14 @@ def extract_duration_fr(text):
         'weeks': 'semaines'
     }
 
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[s]?(\s+|,|$)"
-
     for (unit_en, unit_fr) in time_units.items():
-        unit_pattern = pattern.format(unit=unit_fr[:-1])  # remove 's' from unit
+        unit_pattern = _DURATION_UNIT_PATTERNS_FR[unit_fr]
         time_units[unit_en] = 0
 
         def repl(match):
             time_units[unit_en] += float(match.group(1))
             return ''
-        text = re.sub(unit_pattern, repl, text)
+        text = unit_pattern.sub(repl, text)
 
     text = text.strip()
     duration = timedelta(**time_units) if any(time_units.values()) else None
@@ -1035,7 +1042,7 @@ def normalize_fr(text, remove_articles=True):
     """ French string normalization """
     text = text.lower()
     words = text.split()  # this also removed extra spaces
-    normalized = ""
+    normalized = []
     i = 0
     while i < len(words):
         # remove articles
@@ -1053,19 +1060,19 @@ def normalize_fr(text, remove_articles=True):
             result = _number_ordinal_fr(words, i)
             if result is not None:
                 val, i = result
-                normalized += " " + str(val)
+                normalized.append(str(val))
                 continue
         # Convert numbers into digits
         result = _number_parse_fr(words, i)
         if result is not None:
             val, i = result
-            normalized += " " + str(val)
+            normalized.append(str(val))
             continue
 
-        normalized += " " + words[i]
+        normalized.append(words[i])
         i += 1
 
-    return normalized[1:]  # strip the initial space
+    return " ".join(normalized)
 
 
 def extract_numbers_fr(text, short_scale=True, ordinals=False):
@@ -414,7 +414,7 @@ def normalize_it(text, remove_articles=True):
     words = text.split()  # this also removed extra spaces
     # Contractions are not common in IT
     # Convert numbers into digits, e.g. 'quarantadue' -> '42'
-    normalized = ''
+    normalized = []
     i = 0
 
     while i < len(words):
@@ -433,11 +433,11 @@ def normalize_it(text, remove_articles=True):
         if val:
             word = str(val)
 
-        normalized += ' ' + word
+        normalized.append(word)
         i += 1
     # indefinite articles in it-it can not be removed
 
-    return normalized[1:]
+    return ' '.join(normalized)
 
 
 def extract_datetime_it(text, anchorDate=None, default_time=None):
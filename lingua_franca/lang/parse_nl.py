@@ -28,6 +28,26 @@ from lingua_franca.time import now_local
 import re
 
 
+# Duration patterns per unit, compiled once at import. The longest words
+# of a unit come first, so "seconden" isn't consumed as "seconde".
+_DURATION_UNIT_PATTERNS_NL = tuple(
+    (unit, re.compile(r"(?P<value>\d+(?:\.?\d+)?)\s+{unit}".format(
+        unit=unit_nl)))
+    for unit, unit_nl_words in (
+        ('microseconds', ["microsecond", "microseconde", "microseconden",
+                          "microsecondje", "microsecondjes"]),
+        ('milliseconds', ["millisecond", "milliseconde", "milliseconden",
+                          "millisecondje", "millisecondjes"]),
+        ('seconds', ["second", "seconde", "seconden", "secondje",
+                     "secondjes"]),
+        ('minutes', ["minuut", "minuten", "minuutje", "minuutjes"]),
+        ('hours', ["uur", "uren", "uurtje", "uurtjes"]),
+        ('days', ["dag", "dagen", "dagje", "dagjes"]),
+        ('weeks', ["week", "weken", "weekje", "weekjes"]))
+    for unit_nl in sorted(unit_nl_words, key=len, reverse=True)
+)
+
+
 def _convert_words_to_numbers_nl(text, short_scale=True, ordinals=False):
     """Convert words in a string into their equivalent numbers.
     Args:
@@ -471,28 +491,13 @@ def extract_duration_nl(text):
         'weeks': 0
     }
 
-    nl_translations = {
-        'microseconds': ["microsecond", "microseconde", "microseconden", "microsecondje", "microsecondjes"],
-        'milliseconds': ["millisecond", "milliseconde", "milliseconden", "millisecondje", "millisecondjes"],
-        'seconds': ["second", "seconde", "seconden", "secondje", "secondjes"],
-        'minutes': ["minuut", "minuten", "minuutje", "minuutjes"],
-        'hours': ["uur", "uren", "uurtje", "uurtjes"],
-        'days': ["dag", "dagen", "dagje", "dagjes"],
-        'weeks': ["week", "weken", "weekje", "weekjes"]
-    }
-
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)\s+{unit}"
     text = _convert_words_to_numbers_nl(text)
 
-    for unit in time_units:
-        unit_nl_words = nl_translations[unit]
-        unit_nl_words.sort(key=len, reverse=True)
-        for unit_nl in unit_nl_words:
-            unit_pattern = pattern.format(unit=unit_nl)
-            matches = re.findall(unit_pattern, text)
-            value = sum(map(float, matches))
-            time_units[unit] = time_units[unit] + value
-            text = re.sub(unit_pattern, '', text)
+    for unit, unit_pattern in _DURATION_UNIT_PATTERNS_NL:
+        matches = unit_pattern.findall(text)
+        value = sum(map(float, matches))
+        time_units[unit] = time_units[unit] + value
+        text = unit_pattern.sub('', text)
 
     text = text.strip()
     duration = timedelta(**time_units) if any(time_units.values()) else None
@@ -1316,7 +1321,7 @@ def normalize_nl(text, remove_articles=True):
     """Dutch string normalization."""
 
     words = text.split()  # this also removed extra spaces
-    normalized = ""
+    normalized = []
     for word in words:
         if remove_articles and word in _ARTICLES_NL:
             continue
@@ -1330,9 +1335,9 @@ def normalize_nl(text, remove_articles=True):
         if word in textNumbers:
             word = str(textNumbers.index(word))
 
-        normalized += " " + word
+        normalized.append(word)
 
-    return normalized[1:]  # strip the initial space
+    return " ".join(normalized)
 
 
 class DutchNormalizer(Normalizer):
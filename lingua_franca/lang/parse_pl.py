@@ -26,6 +26,15 @@ from lingua_franca.lang.common_data_pl import _NUM_STRING_PL, \
 from lingua_franca.time import now_local
 import re
 
+# Duration patterns, paired with the English unit they count, compiled
+# once at import.
+_DURATION_UNIT_PATTERNS_PL = tuple(
+    (unit_en, re.compile(
+        r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[ayeę]?".format(
+            unit=unit)))
+    for unit, unit_en in _TIME_UNITS_CONVERSION.items()
+)
+
 
 def generate_plurals_pl(originals):
     """
@@ -635,17 +644,14 @@ def extract_duration_pl(text):
         'weeks': None
     }
 
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[ayeę]?"
     text = _convert_words_to_numbers_pl(text)
 
-    for unit in _TIME_UNITS_CONVERSION:
-        unit_pattern = pattern.format(unit=unit)
-        matches = re.findall(unit_pattern, text)
+    for unit_en, unit_pattern in _DURATION_UNIT_PATTERNS_PL:
+        matches = unit_pattern.findall(text)
         value = sum(map(float, matches))
-        unit_en = _TIME_UNITS_CONVERSION.get(unit)
         if time_units[unit_en] is None or time_units.get(unit_en) == 0:
             time_units[unit_en] = value
-        text = re.sub(unit_pattern, '', text)
+        text = unit_pattern.sub('', text)
 
     text = text.strip()
     duration = timedelta(**time_units) if any(time_units.values()) else None
@@ -1367,7 +1373,7 @@ def normalize_pl(text, remove_articles=True):
     """ Polish string normalization """
 
     words = text.split()  # this also removed extra spaces
-    normalized = ""
+    normalized = []
     for word in words:
         if remove_articles and word in ["i"]:
             continue
@@ -1399,6 +1405,6 @@ def normalize_pl(text, remove_articles=True):
         elif word == 'poranne':
             word = 'rano'
 
-        normalized += " " + word
+        normalized.append(word)
 
-    return normalized[1:]  # strip the initial space
+    return " ".join(normalized)
@@ -27,7 +27,8 @@ from lingua_franca.lang.common_data_pt import _NUMBERS_PT, \
     _FEMALE_DETERMINANTS_PT, _FEMALE_ENDINGS_PT, \
     _MALE_DETERMINANTS_PT, _MALE_ENDINGS_PT, _GENDERS_PT
 from lingua_franca.internal import resolve_resource_file
-from lingua_franca.lang.parse_common import Normalizer
+from lingua_franca.lang.parse_common import Normalizer, \
+    _PERCENT_SPLIT_RE, _HASH_SPLIT_RE
 from lingua_franca.time import now_local
 import json
 import re
@@ -137,11 +138,9 @@ def extract_number_pt(text, short_scale=True, ordinals=False):
                 count += 1
                 continue
             newWords = aWords[count + 2:]
-            newText = ""
-            for word in newWords:
-                newText += word + " "
+            newText = " ".join(newWords)
 
-            afterAndVal = extract_number_pt(newText[:-1])
+            afterAndVal = extract_number_pt(newText)
             if afterAndVal:
                 if result < afterAndVal or result < 20:
                     while afterAndVal > 1:
@@ -158,10 +157,8 @@ def extract_number_pt(text, short_scale=True, ordinals=False):
         elif next_next_word is not None:
             if next_next_word in ands:
                 newWords = aWords[count + 3:]
-                newText = ""
-                for word in newWords:
-                    newText += word + " "
-                afterAndVal = extract_number_pt(newText[:-1])
+                newText = " ".join(newWords)
+                afterAndVal = extract_number_pt(newText)
                 if afterAndVal:
                     if result is None:
                         result = 0
@@ -172,15 +169,13 @@ def extract_number_pt(text, short_scale=True, ordinals=False):
         if next_word in decimals:
             zeros = 0
             newWords = aWords[count + 2:]
-            newText = ""
-            for word in newWords:
-                newText += word + " "
+            newText = " ".join(newWords)
             for word in newWords:
                 if word == "zero" or word == "0":
                     zeros += 1
                 else:
                     break
-            afterDotVal = str(extract_number_pt(newText[:-1]))
+            afterDotVal = str(extract_number_pt(newText))
             afterDotVal = zeros * "0" + afterDotVal
             result = float(str(result) + "." + afterDotVal)
             break
@@ -199,6 +194,9 @@ def extract_number_pt(text, short_scale=True, ordinals=False):
     return result or False
 
 
+_HYPHENATED_WORD_RE_PT = re.compile(r"([a-zA-Z]+)(-)([a-zA-Z]+\b)")
+
+
 class PortugueseNormalizer(Normalizer):
     with open(resolve_resource_file("text/pt-pt/normalize.json")) as f:
         _default_config = json.load(f)
@@ -206,12 +204,11 @@ class PortugueseNormalizer(Normalizer):
     @staticmethod
     def tokenize(utterance):
         # Split things like 12%
-        utterance = re.sub(r"([0-9]+)([\%])", r"\1 \2", utterance)
+        utterance = _PERCENT_SPLIT_RE.sub(r"\1 \2", utterance)
         # Split things like #1
-        utterance = re.sub(r"(\#)([0-9]+\b)", r"\1 \2", utterance)
+        utterance = _HASH_SPLIT_RE.sub(r"\1 \2", utterance)
         # Split things like amo-te
-        utterance = re.sub(r"([a-zA-Z]+)(-)([a-zA-Z]+\b)", r"\1 \2 \3",
-                           utterance)
+        utterance = _HYPHENATED_WORD_RE_PT.sub(r"\1 \2 \3", utterance)
         tokens = utterance.split()
         if tokens[-1] == '-':
             tokens = tokens[:-1]
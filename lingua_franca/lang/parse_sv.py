@@ -764,7 +764,7 @@ def normalize_sv(text, remove_articles=True):
     """ English string normalization """
 
     words = text.split()  # this also removed extra spaces
-    normalized = ''
+    normalized = []
     for word in words:
         # Convert numbers into digits, e.g. "two" -> "2"
         if word == 'en':
@@ -776,9 +776,9 @@ def normalize_sv(text, remove_articles=True):
         if word in textNumbers:
             word = str(textNumbers.index(word))
 
-        normalized += " " + word
+        normalized.append(word)
 
-    return normalized[1:]  # strip the initial space
+    return " ".join(normalized)
 
 
 class SwedishNormalizer(Normalizer):
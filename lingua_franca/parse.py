@@ -14,12 +14,36 @@
 # limitations under the License.
 #
 
+from collections import Counter
 from difflib import SequenceMatcher
+from functools import lru_cache, partial, wraps
+from inspect import signature
+from os import cpu_count
 from warnings import warn
-from lingua_franca.time import now_local
+from lingua_franca import config
+from lingua_franca.time import now_local, to_local
 from lingua_franca.internal import populate_localized_function_dict, \
     get_active_langs, get_full_lang_code, get_primary_lang_code, \
-    get_default_lang, localized_function, _raise_unsupported_language
+    get_default_lang, get_default_loc, localized_function, \
+    load_languages, set_default_lang, _raise_unsupported_language, \
+    _SUPPORTED_LANGUAGES, _SUPPORTED_FULL_LOCALIZATIONS
+
+# (fuzz, process) modules of the optional rapidfuzz package, imported on
+# first use so that it doesn't weigh on the import of this module.
+# False if rapidfuzz is not installed.
+_rapidfuzz = None
+
+
+def _get_rapidfuzz():
+    global _rapidfuzz
+    if _rapidfuzz is None:
+        try:
+            from rapidfuzz import fuzz, process
+            _rapidfuzz = (fuzz, process)
+        except ImportError:
+            _rapidfuzz = False
+    return _rapidfuzz
+
 
 _REGISTERED_FUNCTIONS = ("extract_numbers",
                          "extract_number",
@@ -32,15 +56,232 @@ _REGISTERED_FUNCTIONS = ("extract_numbers",
 
 populate_localized_function_dict("parse", langs=get_active_langs())
 
+_CACHE_SIZE = 4096
+_memoized_functions = []
+
+
+class _Call:
+    """
+    A call's arguments, hashed and compared by their bound, defaulted form.
+
+    The original args and kwargs are kept so a cache miss calls the wrapped
+    function exactly as the caller did.
+    """
+    __slots__ = ('args', 'kwargs', 'key', '_hash')
+
+    def __init__(self, args, kwargs, key):
+        self.args = args
+        self.kwargs = kwargs
+        self.key = key
+        self._hash = hash(key)
 
-def fuzzy_match(x: str, against: str) -> float:
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+
+def _memoize_localized(func):
+    """
+    Memoize a pure, localized parser on its arguments.
+
+    Arguments are bound to the parameters and completed with their defaults
+    for the cache key, so `f("one")`, `f("one", True)` and `f(text="one")`
+    share a cache entry. The result of a localized function also depends on
+    the loaded languages and on the default language, so those are part of
+    the cache key as well. Calls passing the deprecated `lang=None`, or a
+    language code which is not supported as is, are never cached, so that
+    they keep emitting their warnings.
+    Unhashable arguments fall through to the wrapped function.
+    """
+    func_signature = signature(func)
+
+    @lru_cache(maxsize=_CACHE_SIZE)
+    def cached_call(_state, call):
+        return func(*call.args, **call.kwargs)
+
+    @wraps(func)
+    def call_memoized(*args, **kwargs):
+        try:
+            bound = func_signature.bind(*args, **kwargs)
+        except TypeError:
+            # let the function report the bad call itself
+            return func(*args, **kwargs)
+        lang = bound.arguments.get('lang', '')
+        if lang != '' and lang not in _SUPPORTED_LANGUAGES and \
+                lang not in _SUPPORTED_FULL_LOCALIZATIONS:
+            # None, or a code the localizer warns about
+            return func(*args, **kwargs)
+        bound.apply_defaults()
+        state = (get_default_loc(), tuple(get_active_langs()),
+                 config.load_langs_on_demand)
+        try:
+            call = _Call(args, kwargs, tuple(bound.arguments.values()))
+        except TypeError as e:
+            if "unhashable" not in str(e):
+                raise
+            return func(*args, **kwargs)
+        return cached_call(state, call)
+
+    call_memoized.cache_clear = cached_call.cache_clear
+    call_memoized.cache_info = cached_call.cache_info
+    _memoized_functions.append(call_memoized)
+    return call_memoized
+
+
+def cache_clear():
+    """Clear the results memoized by the parsers in this module."""
+    for func in _memoized_functions:
+        func.cache_clear()
+
+
+# strings longer than this are worth bounding natively before running
+# SequenceMatcher, which is quadratic in the worst case
+_NATIVE_BOUND_MIN_LENGTH = 32
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _fuzzy_match(x, against):
+    return SequenceMatcher(None, x, against).ratio()
+
+
+def fuzzy_match(x: str, against: str, min_similarity: float = 0.0) -> float:
     """Perform a 'fuzzy' comparison between two strings.
 
+    Args:
+        x (str): string to compare
+        against (str): string to compare with
+        min_similarity (float): scores below this are not of interest.
+            When cheap upper bounds (from the string lengths, the character
+            counts and, for long strings, rapidfuzz if it is installed) show
+            the score can't reach it, the full comparison is skipped and
+            0.0 is returned.
+
     Returns:
         match percentage -- 1.0 for perfect match,
         down to 0.0 for no match at all.
     """
-    return SequenceMatcher(None, x, against).ratio()
+    if min_similarity > 0.0:
+        length = len(x) + len(against)
+        if length and \
+                2.0 * min(len(x), len(against)) / length < min_similarity:
+            return 0.0
+        common = sum((Counter(x) & Counter(against)).values())
+        if length and 2.0 * common / length < min_similarity:
+            return 0.0
+        if max(len(x), len(against)) > _NATIVE_BOUND_MIN_LENGTH and \
+                _get_rapidfuzz():
+            # see _similarity_bounds() for why this is an upper bound
+            fuzz, _ = _get_rapidfuzz()
+            if fuzz.ratio(x, against) / 100.0 + 1e-9 < min_similarity:
+                return 0.0
+    try:
+        return _fuzzy_match(x, against)
+    except TypeError:
+        # unhashable sequences, e.g. lists of words, can't be cached
+        return SequenceMatcher(None, x, against).ratio()
+
+
+_memoized_functions.append(_fuzzy_match)
+
+
+def _lcs_lengths(a, others):
+    """
+    Lengths of the longest common subsequences of `a` and each string in
+    `others`.
+
+    Bit-parallel algorithm (Allison-Dix, Hyyro): each bit of `v` stands for
+    a position in `a`, and a whole DP column is updated with a few integer
+    operations per character of the other string. The LCS length is the
+    number of zero bits left in `v`. The character masks of `a` are built
+    once and shared by all the comparisons.
+    """
+    masks = {}
+    for i, c in enumerate(a):
+        masks[c] = masks.get(c, 0) | (1 << i)
+    full = (1 << len(a)) - 1
+    lengths = []
+    for b in others:
+        v = full
+        for c in b:
+            u = v & masks.get(c, 0)
+            v = ((v + u) | (v - u)) & full
+        lengths.append(len(a) - bin(v).count("1"))
+    return lengths
+
+
+def _similarity_bounds(query, choices):
+    """
+    Upper bounds of fuzzy_match(query, choice) for each choice, as a list of
+    (bound, index) pairs.
+
+    The blocks found by SequenceMatcher form a common subsequence of both
+    strings, so the InDel similarity 2 * LCS / (len(a) + len(b)) is never
+    below the ratio. It is computed natively by rapidfuzz if available,
+    otherwise with _lcs_lengths().
+    """
+    rapidfuzz = _get_rapidfuzz()
+    if rapidfuzz:
+        fuzz, process = rapidfuzz
+        # allow for rounding in rapidfuzz's percentage score
+        return [(score / 100.0 + 1e-9, index) for _, score, index in
+                process.extract(query, choices, scorer=fuzz.ratio,
+                                processor=None, limit=None)]
+    bounds = []
+    lcs_lengths = _lcs_lengths(query, choices)
+    for index, (choice, lcs) in enumerate(zip(choices, lcs_lengths)):
+        length = len(query) + len(choice)
+        bounds.append((2.0 * lcs / length if length else 1.0, index))
+    return bounds
+
+
+def _match_one_pruned(query, choices):
+    """
+    match_one() for a list of strings, skipping hopeless choices.
+
+    Choices are scored exactly in order of decreasing upper bound (see
+    _similarity_bounds), stopping once no remaining bound can beat the best
+    score. Ties go to the earliest choice, as in a plain loop.
+    """
+    bounds = _similarity_bounds(query, choices)
+    if not bounds:
+        raise IndexError('no choices were provided')
+    bounds.sort(key=lambda b: (-b[0], b[1]))
+    best, best_score, best_index = None, -1.0, None
+    for bound, index in bounds:
+        if bound < best_score:
+            break
+        choice = choices[index]
+        score = fuzzy_match(query, choice)
+        if score > best_score or (score == best_score and index < best_index):
+            best, best_score, best_index = choice, score, index
+    return (best, best_score)
+
+
+class MatchChoices:
+    """
+    Choices for match_one(), prepared once to be matched against many
+    queries.
+
+    The keys are copied, and checked for the fast all-strings path, when
+    the object is built rather than on every match_one() call. Later changes
+    to the original list or dict are not seen.
+
+    Args:
+        choices (list): list or dictionary of choices
+    """
+
+    def __init__(self, choices):
+        if isinstance(choices, dict):
+            self.values = dict(choices)
+            self.keys = list(self.values.keys())
+        elif isinstance(choices, list):
+            self.values = None
+            self.keys = list(choices)
+        else:
+            raise ValueError('a list or dict of choices must be provided')
+        self.all_str = all(isinstance(c, str) for c in self.keys)
 
 
 def match_one(query, choices):
@@ -49,26 +290,27 @@ def match_one(query, choices):
 
         Args:
             query (str): string to test
-            choices (list): list or dictionary of choices
+            choices (list): list or dictionary of choices, or MatchChoices
+                when matching many queries against the same choices
 
         Returns:
             tuple: (best match, score)
     """
-    if isinstance(choices, dict):
-        _choices = list(choices.keys())
-    elif isinstance(choices, list):
-        _choices = choices
-    else:
-        raise ValueError('a list or dict of choices must be provided')
+    if not isinstance(choices, MatchChoices):
+        choices = MatchChoices(choices)
+    _choices = choices.keys
 
-    best = (_choices[0], fuzzy_match(query, _choices[0]))
-    for c in _choices[1:]:
-        score = fuzzy_match(query, c)
-        if score > best[1]:
-            best = (c, score)
-
-    if isinstance(choices, dict):
-        return (choices[best[0]], best[1])
+    if isinstance(query, str) and choices.all_str:
+        best = _match_one_pruned(query, _choices)
+    else:
+        best = (_choices[0], fuzzy_match(query, _choices[0]))
+        for c in _choices[1:]:
+            score = fuzzy_match(query, c, min_similarity=best[1])
+            if score > best[1]:
+                best = (c, score)
+
+    if choices.values is not None:
+        return (choices.values[best[0]], best[1])
     else:
         return best
 
@@ -92,6 +334,34 @@ def extract_numbers(text, short_scale=True, ordinals=False, lang=''):
     """
 
 
+def extract_numbers_batch(texts, short_scale=True, ordinals=False, lang=''):
+    """
+        Extract the numbers in each of a batch of strings.
+
+        Equivalent to calling extract_numbers() on each string, but a string
+        repeated in the batch is only parsed once.
+
+    Args:
+        texts (list): the strings to extract numbers from
+        short_scale (bool): Use "short scale" or "long scale" for large
+            numbers -- over a million.
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+        lang (str, optional): an optional BCP-47 language code, if omitted
+                              the default language will be used.
+    Returns:
+        list: for each string, its list of extracted numbers
+    """
+    parsed = {}
+    results = []
+    for text in texts:
+        if text not in parsed:
+            parsed[text] = extract_numbers(text, short_scale, ordinals, lang)
+        # each result gets its own list, callers may modify them
+        results.append(list(parsed[text]))
+    return results
+
+
+@_memoize_localized
 @localized_function()
 def extract_number(text, short_scale=True, ordinals=False, lang=''):
     """Takes in a string and extracts a number.
@@ -111,6 +381,7 @@ def extract_number(text, short_scale=True, ordinals=False, lang=''):
     """
 
 
+@_memoize_localized
 @localized_function()
 def extract_duration(text, lang=''):
     """ Convert an english phrase into a number of seconds
@@ -197,6 +468,63 @@ def extract_datetime(text, anchorDate=None, lang='', default_time=None):
     """
 
 
+# Fewest texts worth handing to a worker process of extract_datetime_batch().
+# A datetime parse takes a fraction of a millisecond, starting a process
+# takes tens of milliseconds.
+_BATCH_MIN_PER_WORKER = 256
+
+
+def _init_batch_worker(langs, default_lang):
+    """Load the languages of the parent process in a batch worker."""
+    load_languages(langs)
+    set_default_lang(default_lang)
+
+
+def extract_datetime_batch(texts, anchorDate=None, lang='', default_time=None,
+                           workers=None):
+    """
+        Extract the date and time of each of a batch of strings, spreading
+        the strings over worker processes.
+
+        Equivalent to calling extract_datetime() on each string. Parsing is
+        CPU bound, so the parsers run in a multiprocessing.Pool, with the
+        languages loaded in the calling process loaded in every worker.
+
+    Args:
+        texts (list): the strings to extract dates and times from
+        anchorDate (:obj:`datetime`, optional): the date relative dates are
+            resolved against, the same for the whole batch. Defaults to the
+            current local date/time, taken once for the batch.
+        lang (str): the BCP-47 code for the language to use, None uses default
+        default_time (datetime.time): time to use if none was found in
+            the input string.
+        workers (int, optional): most worker processes to use, defaults
+            to the number of CPUs. Each worker gets at least a few hundred
+            strings, so a small batch, or 1 worker, is parsed in the
+            calling process.
+    Returns:
+        list: for each string, what extract_datetime() returns for it
+    """
+    if anchorDate is None:
+        anchorDate = now_local()
+    elif anchorDate.tzinfo is None and config.inject_timezones:
+        # as localized_function() would, workers may have another timezone
+        anchorDate = to_local(anchorDate)
+    extract = partial(extract_datetime, anchorDate=anchorDate, lang=lang,
+                      default_time=default_time)
+    workers = min(workers or cpu_count() or 1,
+                  len(texts) // _BATCH_MIN_PER_WORKER)
+    langs = get_active_langs()
+    if workers <= 1 or not langs:
+        return [extract(text) for text in texts]
+    # imported here, it would slow down the import of this module
+    from multiprocessing import Pool
+    with Pool(workers, _init_batch_worker,
+              (langs, get_default_lang())) as pool:
+        return pool.map(extract, texts)
+
+
+@_memoize_localized
 @localized_function()
 def normalize(text, lang='', remove_articles=True):
     """Prepare a string for parsing
@@ -216,6 +544,30 @@ def normalize(text, lang='', remove_articles=True):
     """
 
 
+def normalize_batch(texts, lang='', remove_articles=True):
+    """Prepare a batch of strings for parsing
+
+    Equivalent to calling normalize() on each string, but a string repeated
+    in the batch is only normalized once.
+
+    Args:
+        texts (list): the strings to normalize
+        lang (str, optional): an optional BCP-47 language code, if omitted
+                              the default language will be used.
+        remove_articles (bool): whether to remove articles (like 'a', or
+                                'the'). True by default.
+
+    Returns:
+        (list): The normalized strings, in the order of texts.
+    """
+    normalized = {}
+    for text in texts:
+        if text not in normalized:
+            normalized[text] = normalize(text, lang, remove_articles)
+    return [normalized[text] for text in texts]
+
+
+@_memoize_localized
 @localized_function()
 def get_gender(word, context="", lang=''):
     """ Guess the gender of a word
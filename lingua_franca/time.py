@@ -16,6 +16,9 @@
 from datetime import datetime
 from dateutil.tz import gettz, tzlocal
 
+SECONDS_PER_MINUTE = 60
+SECONDS_PER_HOUR = 60 * SECONDS_PER_MINUTE
+SECONDS_PER_DAY = 24 * SECONDS_PER_HOUR
 
 __default_tz = None
 
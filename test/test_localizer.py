@@ -95,6 +95,18 @@ class TestDeprecation(unittest.TestCase):
             )
         unload_all_languages()
 
+    def test_deprecate_invalid_lang_memoized(self):
+        unload_all_languages()
+        lingua_franca.load_language('en')
+        # memoized parsers must warn on every call, not just the first
+        for _ in range(2):
+            with self.assertWarns(DeprecationWarning):
+                self.assertEqual(
+                    lingua_franca.parse.normalize("this is a test",
+                                                  lang="english"),
+                    "this is test")
+        unload_all_languages()
+
 
 class TestLanguageLoading(unittest.TestCase):
 
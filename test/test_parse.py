@@ -13,20 +13,38 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import random
 import unittest
 from datetime import datetime, timedelta
+from importlib.util import find_spec
+from unittest.mock import patch
 from dateutil import tz
 
+import lingua_franca.parse
 from lingua_franca import load_language, unload_language, set_default_lang
 from lingua_franca.internal import FunctionNotLocalizedError
 from lingua_franca.time import default_timezone
-from lingua_franca.parse import extract_datetime
+from lingua_franca.parse import extract_datetime, extract_datetime_batch
 from lingua_franca.parse import extract_duration
 from lingua_franca.parse import extract_number, extract_numbers
+from lingua_franca.parse import extract_numbers_batch
 from lingua_franca.parse import fuzzy_match
 from lingua_franca.parse import get_gender
-from lingua_franca.parse import match_one
-from lingua_franca.parse import normalize
+from lingua_franca.parse import match_one, MatchChoices
+from lingua_franca.parse import normalize, normalize_batch
+
+
+# Reference dates for the datetime tests, built once
+# Tue June 27, 2017 @ 1:04pm
+ANCHOR_DATE = datetime(2017, 6, 27, 13, 4, tzinfo=default_timezone())
+# Tue June 27, 2017 @ 10:01:02am
+RELATIVE_ANCHOR_DATE = datetime(2017, 6, 27, 10, 1, 2,
+                                tzinfo=default_timezone())
+
+
+def format_datetime(date):
+    """ Format a datetime as "YYYY-MM-DD HH:MM:SS", dropping the timezone. """
+    return date.replace(tzinfo=None).isoformat(" ", "seconds")
 
 
 def setUpModule():
@@ -39,6 +57,39 @@ def tearDownModule():
     unload_language('en')
 
 
+def match_one_loop(query, choices):
+    """ match_one() as a plain loop over fuzzy_match(), without pruning. """
+    best = (choices[0], fuzzy_match(query, choices[0]))
+    for choice in choices[1:]:
+        score = fuzzy_match(query, choice)
+        if score > best[1]:
+            best = (choice, score)
+    return best
+
+
+def match_one_cases():
+    """ Queries and choice lists, with ties, duplicates and empty strings. """
+    cases = [
+        ("henry", ["kate", "henry", "frank", "henry", "harry"]),
+        ("harr", ["hare", "bar", "barr"]),
+        ("dead", ["cedc", "eb", "", "bbdaba"]),
+        ("tide", ["diet", "edit", "tide", "he or they"]),
+        ("", ["", "a", ""]),
+        ("", ["ab", "cd"]),
+        ("abc", ["", ""]),
+        ("ab", ["ba", "ab", "ba"]),
+        ("x" * 40, ["x" * 39 + "y", "y" + "x" * 39, "x" * 20]),
+    ]
+    rnd = random.Random(7)
+    for _ in range(200):
+        cases.append(("".join(rnd.choice("abcde")
+                              for _ in range(rnd.randint(0, 6))),
+                      ["".join(rnd.choice("abcde")
+                               for _ in range(rnd.randint(0, 6)))
+                       for _ in range(rnd.randint(1, 6))]))
+    return cases
+
+
 class TestFuzzyMatch(unittest.TestCase):
     def test_matches(self):
         self.assertTrue(fuzzy_match("you and me", "you and me") >= 1.0)
@@ -48,6 +99,24 @@ class TestFuzzyMatch(unittest.TestCase):
                         fuzzy_match("you", "you and me"))
         self.assertTrue(fuzzy_match("you and me", "he or they") < 0.2)
 
+    def test_min_similarity(self):
+        self.assertEqual(fuzzy_match("you and me", "you", 0.5), 0.0)
+        self.assertLess(fuzzy_match("you and me", "he or they", 0.5), 0.5)
+        self.assertEqual(fuzzy_match("You", "you", 0.5),
+                         fuzzy_match("You", "you"))
+
+    def test_asymmetric(self):
+        # SequenceMatcher's ratio depends on the order of its arguments
+        self.assertEqual(fuzzy_match("tide", "diet"), 0.25)
+        self.assertEqual(fuzzy_match("diet", "tide"), 0.5)
+        self.assertEqual(match_one("dead", ["cedc", "eb", "", "bbdaba"]),
+                         ("bbdaba", 0.4))
+
+    def test_unhashable(self):
+        self.assertAlmostEqual(fuzzy_match(["a", "b"], ["a"]), 2 / 3)
+        self.assertEqual(match_one(["a", "b"], [["a", "b"], ["b"]]),
+                         (["a", "b"], 1.0))
+
     def test_match_one(self):
         # test list of choices
         choices = ['frank', 'kate', 'harry', 'henry']
@@ -60,8 +129,51 @@ class TestFuzzyMatch(unittest.TestCase):
         self.assertEqual(match_one('frank', choices)[0], 1)
         self.assertEqual(match_one('enry', choices)[0], 4)
 
+    def test_match_one_ties(self):
+        # the first of equally good choices wins
+        choices = ['kate', 'henry', 'frank', 'henry', 'harry']
+        self.assertEqual(match_one('henry', choices), ('henry', 1.0))
+        self.assertEqual(match_one('harr', ['hare', 'bar', 'barr']),
+                         ('hare', 0.75))
+
+    def test_match_one_pruned_native(self):
+        with patch.object(lingua_franca.parse, "_rapidfuzz", False):
+            for query, choices in match_one_cases():
+                with self.subTest(query=query, choices=choices):
+                    self.assertEqual(match_one(query, choices),
+                                     match_one_loop(query, choices))
+
+    @unittest.skipUnless(find_spec("rapidfuzz"), "rapidfuzz is not installed")
+    def test_match_one_pruned_rapidfuzz(self):
+        # None makes match_one() import rapidfuzz again
+        with patch.object(lingua_franca.parse, "_rapidfuzz", None):
+            for query, choices in match_one_cases():
+                with self.subTest(query=query, choices=choices):
+                    self.assertEqual(match_one(query, choices),
+                                     match_one_loop(query, choices))
+            self.assertTrue(lingua_franca.parse._rapidfuzz)
+
+    def test_match_one_prepared(self):
+        names = ['frank', 'kate', 'harry', 'henry']
+        choices = MatchChoices(names)
+        names.append('enry')  # not seen by the prepared choices
+        self.assertEqual(match_one('enry', choices)[0], 'henry')
+        self.assertEqual(match_one('katt', choices)[0], 'kate')
+        choices = MatchChoices({'frank': 1, 'kate': 2, 'harry': 3})
+        self.assertEqual(match_one('fran', choices), (1, 0.8888888888888888))
+        with self.assertRaises(ValueError):
+            MatchChoices(('frank', 'kate'))
+
 
 class TestNormalize(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # normalized once for the class, not on every run of the test
+        cls.NORMALIZED_DATETIME_CASES = tuple(
+            (text, normalize(text), expected_date, expected_leftover)
+            for text, expected_date, expected_leftover in
+            cls.EXTRACT_DATETIME_CASES)
+
     def test_articles(self):
         self.assertEqual(normalize("this is a test", remove_articles=True),
                          "this is test")
@@ -73,6 +185,28 @@ class TestNormalize(unittest.TestCase):
                                    remove_articles=False),
                          "this is an extra test")
 
+    def test_normalize_memoized(self):
+        normalize.cache_clear()
+        self.assertEqual(normalize("this is a test", remove_articles=True),
+                         "this is test")
+        self.assertEqual(normalize("this is a test", remove_articles=False),
+                         "this is a test")
+        self.assertEqual(normalize("this is a test", "", True),
+                         "this is test")
+        # remove_articles is part of the key, spelling of the call is not
+        self.assertEqual(normalize.cache_info().currsize, 2)
+        normalize.cache_clear()
+        self.assertEqual(normalize.cache_info().currsize, 0)
+
+    def test_normalize_batch(self):
+        texts = ["this is a test", "it's two", "this is a test"]
+        self.assertEqual(normalize_batch(texts),
+                         [normalize(text) for text in texts])
+        self.assertEqual(normalize_batch(["this is a test"],
+                                         remove_articles=False),
+                         ["this is a test"])
+        self.assertEqual(normalize_batch([]), [])
+
     def test_extract_number_priority(self):
         # sanity check
         self.assertEqual(extract_number("third", ordinals=True), 3)
@@ -109,7 +243,7 @@ class TestNormalize(unittest.TestCase):
             "this is the 7th test", ordinals=True), 7)
         self.assertEqual(extract_number(
             "this is the 7th test", ordinals=False), 7)
-        self.assertTrue(extract_number("this is the nth test") is False)
+        self.assertIs(extract_number("this is the nth test"), False)
         self.assertEqual(extract_number("this is the 1st test"), 1)
         self.assertEqual(extract_number("this is the 2nd test"), 2)
         self.assertEqual(extract_number("this is the 3rd test"), 3)
@@ -121,30 +255,30 @@ class TestNormalize(unittest.TestCase):
         # test non ambiguous ordinals
         self.assertEqual(extract_number("this is the first test",
                                         ordinals=True), 1)
-        self.assertEqual(extract_number("this is the first test",
-                                        ordinals=False), False)
-        self.assertEqual(extract_number("this is the first test",
-                                        ordinals=None), False)
+        self.assertIs(extract_number("this is the first test",
+                                     ordinals=False), False)
+        self.assertIs(extract_number("this is the first test",
+                                     ordinals=None), False)
 
         # test ambiguous ordinal/time unit
         self.assertEqual(extract_number("this is second test",
                                         ordinals=True), 2)
-        self.assertEqual(extract_number("this is second test",
-                                        ordinals=False), False)
+        self.assertIs(extract_number("this is second test",
+                                     ordinals=False), False)
         self.assertEqual(extract_number("remind me in a second",
                                         ordinals=True), 2)
-        self.assertEqual(extract_number("remind me in a second",
-                                        ordinals=False), False)
-        self.assertEqual(extract_number("remind me in a second",
-                                        ordinals=None), False)
+        self.assertIs(extract_number("remind me in a second",
+                                     ordinals=False), False)
+        self.assertIs(extract_number("remind me in a second",
+                                     ordinals=None), False)
 
         # test ambiguous ordinal/fractional
         self.assertEqual(extract_number("this is the third test",
                                         ordinals=True), 3.0)
         self.assertEqual(extract_number("this is the third test",
                                         ordinals=False), 1.0 / 3.0)
-        self.assertEqual(extract_number("this is the third test",
-                                        ordinals=None), False)
+        self.assertIs(extract_number("this is the third test",
+                                     ordinals=None), False)
 
         self.assertEqual(extract_number("one third of a cup",
                                         ordinals=False), 1.0 / 3.0)
@@ -168,7 +302,7 @@ class TestNormalize(unittest.TestCase):
         self.assertEqual(extract_number("Twenty two and Three Fifths"), 22.6)
 
         # test multiple ambiguous
-        self.assertEqual(extract_number("sixth third", ordinals=None), False)
+        self.assertIs(extract_number("sixth third", ordinals=None), False)
         self.assertEqual(extract_number("thirty second", ordinals=False), 30)
         self.assertEqual(extract_number("thirty second", ordinals=None), 30)
         self.assertEqual(extract_number("thirty second", ordinals=True), 32)
@@ -181,19 +315,23 @@ class TestNormalize(unittest.TestCase):
         # test big numbers / short vs long scale
         self.assertEqual(extract_number("this is the billionth test",
                                         ordinals=True), 1e09)
-        self.assertEqual(extract_number("this is the billionth test",
-                                        ordinals=None), False)
+        self.assertIs(extract_number("this is the billionth test",
+                                     ordinals=None), False)
 
         self.assertEqual(extract_number("this is the billionth test",
                                         ordinals=False), 1e-9)
         self.assertEqual(extract_number("this is the billionth test",
                                         ordinals=True,
                                         short_scale=False), 1e12)
-        self.assertEqual(extract_number("this is the billionth test",
-                                        ordinals=None,
-                                        short_scale=False), False)
+        self.assertIs(extract_number("this is the billionth test",
+                                     ordinals=None,
+                                     short_scale=False), False)
         self.assertEqual(extract_number("this is the billionth test",
                                         short_scale=False), 1e-12)
+        # any falsy short_scale means long scale
+        self.assertEqual(extract_number("two hundred", short_scale=None), 200)
+        self.assertEqual(extract_number("six trillion", short_scale=None),
+                         6e18)
 
         # test the Nth one
         self.assertEqual(extract_number("the fourth one", ordinals=True), 4.0)
@@ -212,137 +350,141 @@ class TestNormalize(unittest.TestCase):
         self.assertEqual(extract_number("you are the 8th one",
                                         ordinals=None), 8)
 
-    def test_extract_number(self):
-
-        self.assertEqual(extract_number("this is 2 test"), 2)
-        self.assertEqual(extract_number("this is test number 4"), 4)
-        self.assertEqual(extract_number("three cups"), 3)
-        self.assertEqual(extract_number("1/3 cups"), 1.0 / 3.0)
-        self.assertEqual(extract_number("quarter cup"), 0.25)
-        self.assertEqual(extract_number("1/4 cup"), 0.25)
-        self.assertEqual(extract_number("one fourth cup"), 0.25)
-        self.assertEqual(extract_number("2/3 cups"), 2.0 / 3.0)
-        self.assertEqual(extract_number("3/4 cups"), 3.0 / 4.0)
-        self.assertEqual(extract_number("1 and 3/4 cups"), 1.75)
-        self.assertEqual(extract_number("1 cup and a half"), 1.5)
-        self.assertEqual(extract_number("one cup and a half"), 1.5)
-        self.assertEqual(extract_number("one and a half cups"), 1.5)
-        self.assertEqual(extract_number("one and one half cups"), 1.5)
-        self.assertEqual(extract_number("three quarter cups"), 3.0 / 4.0)
-        self.assertEqual(extract_number("three quarters cups"), 3.0 / 4.0)
-        self.assertEqual(extract_number("twenty two"), 22)
-        self.assertEqual(extract_number(
-            "Twenty two with a leading capital letter"), 22)
-        self.assertEqual(extract_number(
-            "twenty Two with Two capital letters"), 22)
-        self.assertEqual(extract_number(
-            "twenty Two with mixed capital letters"), 22)
-        self.assertEqual(extract_number("two hundred"), 200)
-        self.assertEqual(extract_number("nine thousand"), 9000)
-        self.assertEqual(extract_number("six hundred sixty six"), 666)
-        self.assertEqual(extract_number("two million"), 2000000)
-        self.assertEqual(extract_number("two million five hundred thousand "
-                                        "tons of spinning metal"), 2500000)
-        self.assertEqual(extract_number("six trillion"), 6000000000000.0)
-        self.assertEqual(extract_number("six trillion", short_scale=False),
-                         6e+18)
-        self.assertEqual(extract_number("one point five"), 1.5)
-        self.assertEqual(extract_number("three dot fourteen"), 3.14)
-        self.assertEqual(extract_number("zero point two"), 0.2)
-        self.assertEqual(extract_number("billions of years older"),
-                         1000000000.0)
-        self.assertEqual(extract_number("billions of years older",
-                                        short_scale=False),
-                         1000000000000.0)
-        self.assertEqual(extract_number("one hundred thousand"), 100000)
-        self.assertEqual(extract_number("minus 2"), -2)
-        self.assertEqual(extract_number("negative seventy"), -70)
-        self.assertEqual(extract_number("thousand million"), 1000000000)
-
+    # (text, kwargs, expected value) triples for test_extract_number
+    EXTRACT_NUMBER_CASES = (
+        ("this is 2 test", {}, 2),
+        ("this is test number 4", {}, 4),
+        ("three cups", {}, 3),
+        ("1/3 cups", {}, 1.0 / 3.0),
+        ("quarter cup", {}, 0.25),
+        ("1/4 cup", {}, 0.25),
+        ("one fourth cup", {}, 0.25),
+        ("2/3 cups", {}, 2.0 / 3.0),
+        ("3/4 cups", {}, 3.0 / 4.0),
+        ("1 and 3/4 cups", {}, 1.75),
+        ("1 cup and a half", {}, 1.5),
+        ("one cup and a half", {}, 1.5),
+        ("one and a half cups", {}, 1.5),
+        ("one and one half cups", {}, 1.5),
+        ("three quarter cups", {}, 3.0 / 4.0),
+        ("three quarters cups", {}, 3.0 / 4.0),
+        ("twenty two", {}, 22),
+        ("Twenty two with a leading capital letter", {}, 22),
+        ("twenty Two with Two capital letters", {}, 22),
+        ("twenty Two with mixed capital letters", {}, 22),
+        ("two hundred", {}, 200),
+        ("nine thousand", {}, 9000),
+        ("six hundred sixty six", {}, 666),
+        ("two million", {}, 2000000),
+        ("two million five hundred thousand tons of spinning metal", {},
+         2500000),
+        ("six trillion", {}, 6000000000000.0),
+        ("six trillion", {"short_scale": False}, 6e+18),
+        ("one point five", {}, 1.5),
+        ("three dot fourteen", {}, 3.14),
+        ("zero point two", {}, 0.2),
+        ("billions of years older", {}, 1000000000.0),
+        ("billions of years older", {"short_scale": False}, 1000000000000.0),
+        ("one hundred thousand", {}, 100000),
+        ("minus 2", {}, -2),
+        ("negative seventy", {}, -70),
+        ("thousand million", {}, 1000000000),
         # Verify non-power multiples of ten no longer discard
         # adjacent multipliers
-        self.assertEqual(extract_number("twenty thousand"), 20000)
-        self.assertEqual(extract_number("fifty million"), 50000000)
-
-        # Verify smaller powers of ten no longer cause miscalculation of larger
-        # powers of ten (see MycroftAI#86)
-        self.assertEqual(extract_number("twenty billion three hundred million \
+        ("twenty thousand", {}, 20000),
+        ("fifty million", {}, 50000000),
+        # Verify smaller powers of ten no longer cause miscalculation of
+        # larger powers of ten (see MycroftAI#86)
+        ("twenty billion three hundred million \
                                         nine hundred fifty thousand six hundred \
-                                        seventy five point eight"),
-                         20300950675.8)
-        self.assertEqual(extract_number("nine hundred ninety nine million nine \
+                                        seventy five point eight", {},
+         20300950675.8),
+        ("nine hundred ninety nine million nine \
                                         hundred ninety nine thousand nine \
-                                        hundred ninety nine point nine"),
-                         999999999.9)
-
+                                        hundred ninety nine point nine", {},
+         999999999.9),
         # TODO why does "trillion" result in xxxx.0?
-        self.assertEqual(extract_number("eight hundred trillion two hundred \
-                                        fifty seven"), 800000000000257.0)
-
+        ("eight hundred trillion two hundred \
+                                        fifty seven", {}, 800000000000257.0),
         # TODO handle this case
-        # self.assertEqual(
-        #    extract_number("6 dot six six six"),
-        #    6.666)
-        self.assertTrue(extract_number("The tennis player is fast") is False)
-        self.assertTrue(extract_number("fraggle") is False)
-
-        self.assertTrue(extract_number("fraggle zero") is not False)
-        self.assertEqual(extract_number("fraggle zero"), 0)
+        # ("6 dot six six six", {}, 6.666),
+        ("fraggle zero", {}, 0),
+        ("grobo 0", {}, 0),
+        ("a couple of beers", {}, 2),
+        ("a couple hundred beers", {}, 200),
+        ("a couple thousand beers", {}, 2000),
+        ("totally 100%", {}, 100),
+    )
 
-        self.assertTrue(extract_number("grobo 0") is not False)
-        self.assertEqual(extract_number("grobo 0"), 0)
-
-        self.assertEqual(extract_number("a couple of beers"), 2)
-        self.assertEqual(extract_number("a couple hundred beers"), 200)
-        self.assertEqual(extract_number("a couple thousand beers"), 2000)
-        self.assertEqual(extract_number("totally 100%"), 100)
+    def test_extract_number(self):
+        extract = extract_number
+        for text, kwargs, expected in self.EXTRACT_NUMBER_CASES:
+            with self.subTest(text=text, **kwargs):
+                self.assertEqual(extract(text, **kwargs), expected)
+
+        # False and 0 compare equal, check the identity explicitly
+        self.assertIs(extract("The tennis player is fast"), False)
+        self.assertIs(extract("fraggle"), False)
+        self.assertIsNot(extract("fraggle zero"), False)
+        self.assertIsNot(extract("grobo 0"), False)
+
+    # (text, expected (duration, remainder)) pairs
+    EXTRACT_DURATION_CASES = (
+        ("10 seconds", (timedelta(seconds=10.0), "")),
+        ("5 minutes", (timedelta(minutes=5), "")),
+        ("2 hours", (timedelta(hours=2), "")),
+        ("3 days", (timedelta(days=3), "")),
+        ("25 weeks", (timedelta(weeks=25), "")),
+        ("seven hours", (timedelta(hours=7), "")),
+        ("7.5 seconds", (timedelta(seconds=7.5), "")),
+        ("eight and a half days thirty nine seconds",
+         (timedelta(days=8.5, seconds=39), "")),
+        ("wake me up in three weeks, four hundred ninety seven days, and"
+         " three hundred 91.6 seconds",
+         (timedelta(weeks=3, days=497, seconds=391.6),
+          "wake me up in , , and")),
+        ("10-seconds", (timedelta(seconds=10.0), "")),
+        ("5-minutes", (timedelta(minutes=5), "")),
+    )
+
+    EXTRACT_DURATION_CASE_CASES = (
+        ("Set a timer for 30 minutes",
+         (timedelta(minutes=30), "Set a timer for")),
+        ("The movie is one hour, fifty seven and a half minutes long",
+         (timedelta(hours=1, minutes=57.5), "The movie is ,  long")),
+        ("Four and a Half minutes until sunset",
+         (timedelta(minutes=4.5), "until sunset")),
+        ("Nineteen minutes past THE hour",
+         (timedelta(minutes=19), "past THE hour")),
+    )
 
     def test_extract_duration_en(self):
-        self.assertEqual(extract_duration("10 seconds"),
-                         (timedelta(seconds=10.0), ""))
-        self.assertEqual(extract_duration("5 minutes"),
-                         (timedelta(minutes=5), ""))
-        self.assertEqual(extract_duration("2 hours"),
-                         (timedelta(hours=2), ""))
-        self.assertEqual(extract_duration("3 days"),
-                         (timedelta(days=3), ""))
-        self.assertEqual(extract_duration("25 weeks"),
-                         (timedelta(weeks=25), ""))
-        self.assertEqual(extract_duration("seven hours"),
-                         (timedelta(hours=7), ""))
-        self.assertEqual(extract_duration("7.5 seconds"),
-                         (timedelta(seconds=7.5), ""))
-        self.assertEqual(extract_duration("eight and a half days thirty"
-                                          " nine seconds"),
-                         (timedelta(days=8.5, seconds=39), ""))
-        self.assertEqual(extract_duration("wake me up in three weeks, four"
-                                          " hundred ninety seven days, and"
-                                          " three hundred 91.6 seconds"),
-                         (timedelta(weeks=3, days=497, seconds=391.6),
-                          "wake me up in , , and"))
-        self.assertEqual(extract_duration("10-seconds"),
-                         (timedelta(seconds=10.0), ""))
-        self.assertEqual(extract_duration("5-minutes"),
-                         (timedelta(minutes=5), ""))
+        extract = extract_duration
+        for text, expected in self.EXTRACT_DURATION_CASES:
+            with self.subTest(text=text):
+                self.assertEqual(extract(text), expected)
+
+    def test_extract_duration_memoized(self):
+        extract_duration.cache_clear()
+        expected = (timedelta(minutes=10), "")
+        self.assertEqual(extract_duration("ten minutes"), expected)
+        self.assertEqual(extract_duration("ten minutes", ""), expected)
+        self.assertEqual(extract_duration(text="ten minutes"), expected)
+        # equivalent calls share a single cache entry
+        self.assertEqual(extract_duration.cache_info().currsize, 1)
 
     def test_extract_duration_case_en(self):
-        self.assertEqual(extract_duration("Set a timer for 30 minutes"),
-                         (timedelta(minutes=30), "Set a timer for"))
-        self.assertEqual(extract_duration("The movie is one hour, fifty seven"
-                                          " and a half minutes long"),
-                         (timedelta(hours=1, minutes=57.5),
-                             "The movie is ,  long"))
-        self.assertEqual(extract_duration("Four and a Half minutes until"
-                                          " sunset"),
-                         (timedelta(minutes=4.5), "until sunset"))
-        self.assertEqual(extract_duration("Nineteen minutes past THE hour"),
-                         (timedelta(minutes=19), "past THE hour"))
+        extract = extract_duration
+        for text, expected in self.EXTRACT_DURATION_CASE_CASES:
+            with self.subTest(text=text):
+                self.assertEqual(extract(text), expected)
 
     def test_extractdatetime_fractions_en(self):
+        date = ANCHOR_DATE
+
         def extractWithFormat(text):
-            date = datetime(2017, 6, 27, 13, 4, tzinfo=default_timezone())  # Tue June 27, 2017 @ 1:04pm
             [extractedDate, leftover] = extract_datetime(text, date)
-            extractedDate = extractedDate.strftime("%Y-%m-%d %H:%M:%S")
+            extractedDate = format_datetime(extractedDate)
             return [extractedDate, leftover]
 
         def testExtract(text, expected_date, expected_leftover):
@@ -361,354 +503,365 @@ class TestNormalize(unittest.TestCase):
         testExtract("remind me to call mom in a quarter of an hour",
                     "2017-06-27 13:19:00", "remind me to call mom")
 
-    def test_extractdatetime_en(self):
-        def extractWithFormat(text):
-            date = datetime(2017, 6, 27, 13, 4, tzinfo=default_timezone())  # Tue June 27, 2017 @ 1:04pm
-            [extractedDate, leftover] = extract_datetime(text, date)
-            extractedDate = extractedDate.strftime("%Y-%m-%d %H:%M:%S")
-            return [extractedDate, leftover]
-
-        def testExtract(text, expected_date, expected_leftover):
-            res = extractWithFormat(normalize(text))
-            self.assertEqual(res[0], expected_date, "for=" + text)
-            self.assertEqual(res[1], expected_leftover, "for=" + text)
-
-        testExtract("now is the time",
-                    "2017-06-27 13:04:00", "is time")
-        testExtract("in a second",
-                    "2017-06-27 13:04:01", "")
-        testExtract("in a minute",
-                    "2017-06-27 13:05:00", "")
-        testExtract("in a couple minutes",
-                    "2017-06-27 13:06:00", "")
-        testExtract("in a couple of minutes",
-                    "2017-06-27 13:06:00", "")
-        testExtract("in a couple hours",
-                    "2017-06-27 15:04:00", "")
-        testExtract("in a couple of hours",
-                    "2017-06-27 15:04:00", "")
-        testExtract("in a couple weeks",
-                    "2017-07-11 00:00:00", "")
-        testExtract("in a couple of weeks",
-                    "2017-07-11 00:00:00", "")
-        testExtract("in a couple months",
-                    "2017-08-27 00:00:00", "")
-        testExtract("in a couple years",
-                    "2019-06-27 00:00:00", "")
-        testExtract("in a couple of months",
-                    "2017-08-27 00:00:00", "")
-        testExtract("in a couple of years",
-                    "2019-06-27 00:00:00", "")
-        testExtract("in a decade",
-                    "2027-06-27 00:00:00", "")
-        testExtract("in a couple of decades",
-                    "2037-06-27 00:00:00", "")
-        testExtract("next decade",
-                    "2027-06-27 00:00:00", "")
-        testExtract("in a century",
-                    "2117-06-27 00:00:00", "")
-        testExtract("in a millennium",
-                    "3017-06-27 00:00:00", "")
-        testExtract("in a couple decades",
-                    "2037-06-27 00:00:00", "")
-        testExtract("in 5 decades",
-                    "2067-06-27 00:00:00", "")
-        testExtract("in a couple centuries",
-                    "2217-06-27 00:00:00", "")
-        testExtract("in a couple of centuries",
-                    "2217-06-27 00:00:00", "")
-        testExtract("in 2 centuries",
-                    "2217-06-27 00:00:00", "")
-        testExtract("in a couple millenniums",
-                    "4017-06-27 00:00:00", "")
-        testExtract("in a couple of millenniums",
-                    "4017-06-27 00:00:00", "")
-        testExtract("in an hour",
-                    "2017-06-27 14:04:00", "")
-        testExtract("i want it within the hour",
-                    "2017-06-27 14:04:00", "i want it")
-        testExtract("in 1 second",
-                    "2017-06-27 13:04:01", "")
-        testExtract("in 2 seconds",
-                    "2017-06-27 13:04:02", "")
-        testExtract("Set the ambush in 1 minute",
-                    "2017-06-27 13:05:00", "set ambush")
-        testExtract("Set the ambush for 5 days from today",
-                    "2017-07-02 00:00:00", "set ambush")
-        testExtract("day after tomorrow",
-                    "2017-06-29 00:00:00", "")
-        testExtract("What is the day after tomorrow's weather?",
-                    "2017-06-29 00:00:00", "what is weather")
-        testExtract("Remind me at 10:45 pm",
-                    "2017-06-27 22:45:00", "remind me")
-        testExtract("what is the weather on friday morning",
-                    "2017-06-30 08:00:00", "what is weather")
-        testExtract("what is tomorrow's weather",
-                    "2017-06-28 00:00:00", "what is weather")
-        testExtract("what is this afternoon's weather",
-                    "2017-06-27 15:00:00", "what is weather")
-        testExtract("what is this evening's weather",
-                    "2017-06-27 19:00:00", "what is weather")
-        testExtract("what was this morning's weather",
-                    "2017-06-27 08:00:00", "what was weather")
-        testExtract("remind me to call mom in 8 weeks and 2 days",
-                    "2017-08-24 00:00:00", "remind me to call mom")
-        testExtract("remind me to call mom on august 3rd",
-                    "2017-08-03 00:00:00", "remind me to call mom")
-        testExtract("remind me tomorrow to call mom at 7am",
-                    "2017-06-28 07:00:00", "remind me to call mom")
-        testExtract("remind me tomorrow to call mom at 10pm",
-                    "2017-06-28 22:00:00", "remind me to call mom")
-        testExtract("remind me to call mom at 7am",
-                    "2017-06-28 07:00:00", "remind me to call mom")
-        testExtract("remind me to call mom in an hour",
-                    "2017-06-27 14:04:00", "remind me to call mom")
-        testExtract("remind me to call mom at 1730",
-                    "2017-06-27 17:30:00", "remind me to call mom")
-        testExtract("remind me to call mom at 0630",
-                    "2017-06-28 06:30:00", "remind me to call mom")
-        testExtract("remind me to call mom at 06 30 hours",
-                    "2017-06-28 06:30:00", "remind me to call mom")
-        testExtract("remind me to call mom at 06 30",
-                    "2017-06-28 06:30:00", "remind me to call mom")
-        testExtract("remind me to call mom at 06 30 hours",
-                    "2017-06-28 06:30:00", "remind me to call mom")
-        testExtract("remind me to call mom at 7 o'clock",
-                    "2017-06-27 19:00:00", "remind me to call mom")
-        testExtract("remind me to call mom this evening at 7 o'clock",
-                    "2017-06-27 19:00:00", "remind me to call mom")
-        testExtract("remind me to call mom  at 7 o'clock tonight",
-                    "2017-06-27 19:00:00", "remind me to call mom")
-        testExtract("remind me to call mom at 7 o'clock in the morning",
-                    "2017-06-28 07:00:00", "remind me to call mom")
-        testExtract("remind me to call mom Thursday evening at 7 o'clock",
-                    "2017-06-29 19:00:00", "remind me to call mom")
-        testExtract("remind me to call mom Thursday morning at 7 o'clock",
-                    "2017-06-29 07:00:00", "remind me to call mom")
-        testExtract("remind me to call mom at 7 o'clock Thursday morning",
-                    "2017-06-29 07:00:00", "remind me to call mom")
-        testExtract("remind me to call mom at 7:00 Thursday morning",
-                    "2017-06-29 07:00:00", "remind me to call mom")
+    EXTRACT_DATETIME_CASES = (
+        ("now is the time",
+         "2017-06-27 13:04:00", "is time"),
+        ("in a second",
+         "2017-06-27 13:04:01", ""),
+        ("in a minute",
+         "2017-06-27 13:05:00", ""),
+        ("in a couple minutes",
+         "2017-06-27 13:06:00", ""),
+        ("in a couple of minutes",
+         "2017-06-27 13:06:00", ""),
+        ("in a couple hours",
+         "2017-06-27 15:04:00", ""),
+        ("in a couple of hours",
+         "2017-06-27 15:04:00", ""),
+        ("in a couple weeks",
+         "2017-07-11 00:00:00", ""),
+        ("in a couple of weeks",
+         "2017-07-11 00:00:00", ""),
+        ("in a couple months",
+         "2017-08-27 00:00:00", ""),
+        ("in a couple years",
+         "2019-06-27 00:00:00", ""),
+        ("in a couple of months",
+         "2017-08-27 00:00:00", ""),
+        ("in a couple of years",
+         "2019-06-27 00:00:00", ""),
+        ("in a decade",
+         "2027-06-27 00:00:00", ""),
+        ("in a couple of decades",
+         "2037-06-27 00:00:00", ""),
+        ("next decade",
+         "2027-06-27 00:00:00", ""),
+        ("in a century",
+         "2117-06-27 00:00:00", ""),
+        ("in a millennium",
+         "3017-06-27 00:00:00", ""),
+        ("in a couple decades",
+         "2037-06-27 00:00:00", ""),
+        ("in 5 decades",
+         "2067-06-27 00:00:00", ""),
+        ("in a couple centuries",
+         "2217-06-27 00:00:00", ""),
+        ("in a couple of centuries",
+         "2217-06-27 00:00:00", ""),
+        ("in 2 centuries",
+         "2217-06-27 00:00:00", ""),
+        ("in a couple millenniums",
+         "4017-06-27 00:00:00", ""),
+        ("in a couple of millenniums",
+         "4017-06-27 00:00:00", ""),
+        ("in an hour",
+         "2017-06-27 14:04:00", ""),
+        ("i want it within the hour",
+         "2017-06-27 14:04:00", "i want it"),
+        ("in 1 second",
+         "2017-06-27 13:04:01", ""),
+        ("in 2 seconds",
+         "2017-06-27 13:04:02", ""),
+        ("Set the ambush in 1 minute",
+         "2017-06-27 13:05:00", "set ambush"),
+        ("Set the ambush for 5 days from today",
+         "2017-07-02 00:00:00", "set ambush"),
+        ("day after tomorrow",
+         "2017-06-29 00:00:00", ""),
+        ("What is the day after tomorrow's weather?",
+         "2017-06-29 00:00:00", "what is weather"),
+        ("Remind me at 10:45 pm",
+         "2017-06-27 22:45:00", "remind me"),
+        ("what is the weather on friday morning",
+         "2017-06-30 08:00:00", "what is weather"),
+        ("what is tomorrow's weather",
+         "2017-06-28 00:00:00", "what is weather"),
+        ("what is this afternoon's weather",
+         "2017-06-27 15:00:00", "what is weather"),
+        ("what is this evening's weather",
+         "2017-06-27 19:00:00", "what is weather"),
+        ("what was this morning's weather",
+         "2017-06-27 08:00:00", "what was weather"),
+        ("remind me to call mom in 8 weeks and 2 days",
+         "2017-08-24 00:00:00", "remind me to call mom"),
+        ("remind me to call mom on august 3rd",
+         "2017-08-03 00:00:00", "remind me to call mom"),
+        ("remind me tomorrow to call mom at 7am",
+         "2017-06-28 07:00:00", "remind me to call mom"),
+        ("remind me tomorrow to call mom at 10pm",
+         "2017-06-28 22:00:00", "remind me to call mom"),
+        ("remind me to call mom at 7am",
+         "2017-06-28 07:00:00", "remind me to call mom"),
+        ("remind me to call mom in an hour",
+         "2017-06-27 14:04:00", "remind me to call mom"),
+        ("remind me to call mom at 1730",
+         "2017-06-27 17:30:00", "remind me to call mom"),
+        ("remind me to call mom at 0630",
+         "2017-06-28 06:30:00", "remind me to call mom"),
+        ("remind me to call mom at 06 30 hours",
+         "2017-06-28 06:30:00", "remind me to call mom"),
+        ("remind me to call mom at 06 30",
+         "2017-06-28 06:30:00", "remind me to call mom"),
+        ("remind me to call mom at 7 o'clock",
+         "2017-06-27 19:00:00", "remind me to call mom"),
+        ("remind me to call mom this evening at 7 o'clock",
+         "2017-06-27 19:00:00", "remind me to call mom"),
+        ("remind me to call mom  at 7 o'clock tonight",
+         "2017-06-27 19:00:00", "remind me to call mom"),
+        ("remind me to call mom at 7 o'clock in the morning",
+         "2017-06-28 07:00:00", "remind me to call mom"),
+        ("remind me to call mom Thursday evening at 7 o'clock",
+         "2017-06-29 19:00:00", "remind me to call mom"),
+        ("remind me to call mom Thursday morning at 7 o'clock",
+         "2017-06-29 07:00:00", "remind me to call mom"),
+        ("remind me to call mom at 7 o'clock Thursday morning",
+         "2017-06-29 07:00:00", "remind me to call mom"),
+        ("remind me to call mom at 7:00 Thursday morning",
+         "2017-06-29 07:00:00", "remind me to call mom"),
         # TODO: This test is imperfect due to the "at 7:00" still in the
         #       remainder.  But let it pass for now since time is correct
-        testExtract("remind me to call mom at 7:00 Thursday evening",
-                    "2017-06-29 19:00:00", "remind me to call mom at 7:00")
-        testExtract("remind me to call mom at 8 Wednesday evening",
-                    "2017-06-28 20:00:00", "remind me to call mom")
-        testExtract("remind me to call mom at 8 Wednesday in the evening",
-                    "2017-06-28 20:00:00", "remind me to call mom")
-        testExtract("remind me to call mom Wednesday evening at 8",
-                    "2017-06-28 20:00:00", "remind me to call mom")
-        testExtract("remind me to call mom in two hours",
-                    "2017-06-27 15:04:00", "remind me to call mom")
-        testExtract("remind me to call mom in 2 hours",
-                    "2017-06-27 15:04:00", "remind me to call mom")
-        testExtract("remind me to call mom in 15 minutes",
-                    "2017-06-27 13:19:00", "remind me to call mom")
-        testExtract("remind me to call mom in fifteen minutes",
-                    "2017-06-27 13:19:00", "remind me to call mom")
-        testExtract("remind me to call mom at 10am 2 days after this saturday",
-                    "2017-07-03 10:00:00", "remind me to call mom")
-        testExtract("Play Rick Astley music 2 days from Friday",
-                    "2017-07-02 00:00:00", "play rick astley music")
-        testExtract("Begin the invasion at 3:45 pm on Thursday",
-                    "2017-06-29 15:45:00", "begin invasion")
-        testExtract("On Monday, order pie from the bakery",
-                    "2017-07-03 00:00:00", "order pie from bakery")
-        testExtract("Play Happy Birthday music 5 years from today",
-                    "2022-06-27 00:00:00", "play happy birthday music")
-        testExtract("Skype Mom at 12:45 pm next Thursday",
-                    "2017-07-06 12:45:00", "skype mom")
-        testExtract("What's the weather next Friday?",
-                    "2017-06-30 00:00:00", "what weather")
-        testExtract("What's the weather next Wednesday?",
-                    "2017-07-05 00:00:00", "what weather")
-        testExtract("What's the weather next Thursday?",
-                    "2017-07-06 00:00:00", "what weather")
-        testExtract("what is the weather next friday morning",
-                    "2017-06-30 08:00:00", "what is weather")
-        testExtract("what is the weather next friday evening",
-                    "2017-06-30 19:00:00", "what is weather")
-        testExtract("what is the weather next friday afternoon",
-                    "2017-06-30 15:00:00", "what is weather")
-        testExtract("remind me to call mom on august 3rd",
-                    "2017-08-03 00:00:00", "remind me to call mom")
-        testExtract("Buy fireworks on the 4th of July",
-                    "2017-07-04 00:00:00", "buy fireworks")
-        testExtract("what is the weather 2 weeks from next friday",
-                    "2017-07-14 00:00:00", "what is weather")
-        testExtract("what is the weather wednesday at 0700 hours",
-                    "2017-06-28 07:00:00", "what is weather")
-        testExtract("set an alarm wednesday at 7 o'clock",
-                    "2017-06-28 07:00:00", "set alarm")
-        testExtract("Set up an appointment at 12:45 pm next Thursday",
-                    "2017-07-06 12:45:00", "set up appointment")
-        testExtract("What's the weather this Thursday?",
-                    "2017-06-29 00:00:00", "what weather")
-        testExtract("set up the visit for 2 weeks and 6 days from Saturday",
-                    "2017-07-21 00:00:00", "set up visit")
-        testExtract("Begin the invasion at 03 45 on Thursday",
-                    "2017-06-29 03:45:00", "begin invasion")
-        testExtract("Begin the invasion at o 800 hours on Thursday",
-                    "2017-06-29 08:00:00", "begin invasion")
-        testExtract("Begin the party at 8 o'clock in the evening on Thursday",
-                    "2017-06-29 20:00:00", "begin party")
-        testExtract("Begin the invasion at 8 in the evening on Thursday",
-                    "2017-06-29 20:00:00", "begin invasion")
-        testExtract("Begin the invasion on Thursday at noon",
-                    "2017-06-29 12:00:00", "begin invasion")
-        testExtract("Begin the invasion on Thursday at midnight",
-                    "2017-06-29 00:00:00", "begin invasion")
-        testExtract("Begin the invasion on Thursday at 0500",
-                    "2017-06-29 05:00:00", "begin invasion")
-        testExtract("remind me to wake up in 4 years",
-                    "2021-06-27 00:00:00", "remind me to wake up")
-        testExtract("remind me to wake up in 4 years and 4 days",
-                    "2021-07-01 00:00:00", "remind me to wake up")
-        testExtract("What is the weather 3 days after tomorrow?",
-                    "2017-07-01 00:00:00", "what is weather")
-        testExtract("december 3",
-                    "2017-12-03 00:00:00", "")
-        testExtract("lets meet at 8:00 tonight",
-                    "2017-06-27 20:00:00", "lets meet")
-        testExtract("lets meet at 5pm",
-                    "2017-06-27 17:00:00", "lets meet")
-        testExtract("lets meet at 8 a.m.",
-                    "2017-06-28 08:00:00", "lets meet")
-        testExtract("remind me to wake up at 8 a.m",
-                    "2017-06-28 08:00:00", "remind me to wake up")
-        testExtract("what is the weather on tuesday",
-                    "2017-06-27 00:00:00", "what is weather")
-        testExtract("what is the weather on monday",
-                    "2017-07-03 00:00:00", "what is weather")
-        testExtract("what is the weather this wednesday",
-                    "2017-06-28 00:00:00", "what is weather")
-        testExtract("on thursday what is the weather",
-                    "2017-06-29 00:00:00", "what is weather")
-        testExtract("on this thursday what is the weather",
-                    "2017-06-29 00:00:00", "what is weather")
-        testExtract("on last monday what was the weather",
-                    "2017-06-26 00:00:00", "what was weather")
-        testExtract("set an alarm for wednesday evening at 8",
-                    "2017-06-28 20:00:00", "set alarm")
-        testExtract("set an alarm for wednesday at 3 o'clock in the afternoon",
-                    "2017-06-28 15:00:00", "set alarm")
-        testExtract("set an alarm for wednesday at 3 o'clock in the morning",
-                    "2017-06-28 03:00:00", "set alarm")
-        testExtract("set an alarm for wednesday morning at 7 o'clock",
-                    "2017-06-28 07:00:00", "set alarm")
-        testExtract("set an alarm for today at 7 o'clock",
-                    "2017-06-27 19:00:00", "set alarm")
-        testExtract("set an alarm for this evening at 7 o'clock",
-                    "2017-06-27 19:00:00", "set alarm")
+        ("remind me to call mom at 7:00 Thursday evening",
+         "2017-06-29 19:00:00", "remind me to call mom at 7:00"),
+        ("remind me to call mom at 8 Wednesday evening",
+         "2017-06-28 20:00:00", "remind me to call mom"),
+        ("remind me to call mom at 8 Wednesday in the evening",
+         "2017-06-28 20:00:00", "remind me to call mom"),
+        ("remind me to call mom Wednesday evening at 8",
+         "2017-06-28 20:00:00", "remind me to call mom"),
+        ("remind me to call mom in two hours",
+         "2017-06-27 15:04:00", "remind me to call mom"),
+        ("remind me to call mom in 2 hours",
+         "2017-06-27 15:04:00", "remind me to call mom"),
+        ("remind me to call mom in 15 minutes",
+         "2017-06-27 13:19:00", "remind me to call mom"),
+        ("remind me to call mom in fifteen minutes",
+         "2017-06-27 13:19:00", "remind me to call mom"),
+        ("remind me to call mom at 10am 2 days after this saturday",
+         "2017-07-03 10:00:00", "remind me to call mom"),
+        ("Play Rick Astley music 2 days from Friday",
+         "2017-07-02 00:00:00", "play rick astley music"),
+        ("Begin the invasion at 3:45 pm on Thursday",
+         "2017-06-29 15:45:00", "begin invasion"),
+        ("On Monday, order pie from the bakery",
+         "2017-07-03 00:00:00", "order pie from bakery"),
+        ("Play Happy Birthday music 5 years from today",
+         "2022-06-27 00:00:00", "play happy birthday music"),
+        ("Skype Mom at 12:45 pm next Thursday",
+         "2017-07-06 12:45:00", "skype mom"),
+        ("What's the weather next Friday?",
+         "2017-06-30 00:00:00", "what weather"),
+        ("What's the weather next Wednesday?",
+         "2017-07-05 00:00:00", "what weather"),
+        ("What's the weather next Thursday?",
+         "2017-07-06 00:00:00", "what weather"),
+        ("what is the weather next friday morning",
+         "2017-06-30 08:00:00", "what is weather"),
+        ("what is the weather next friday evening",
+         "2017-06-30 19:00:00", "what is weather"),
+        ("what is the weather next friday afternoon",
+         "2017-06-30 15:00:00", "what is weather"),
+        ("Buy fireworks on the 4th of July",
+         "2017-07-04 00:00:00", "buy fireworks"),
+        ("what is the weather 2 weeks from next friday",
+         "2017-07-14 00:00:00", "what is weather"),
+        ("what is the weather wednesday at 0700 hours",
+         "2017-06-28 07:00:00", "what is weather"),
+        ("set an alarm wednesday at 7 o'clock",
+         "2017-06-28 07:00:00", "set alarm"),
+        ("Set up an appointment at 12:45 pm next Thursday",
+         "2017-07-06 12:45:00", "set up appointment"),
+        ("What's the weather this Thursday?",
+         "2017-06-29 00:00:00", "what weather"),
+        ("set up the visit for 2 weeks and 6 days from Saturday",
+         "2017-07-21 00:00:00", "set up visit"),
+        ("Begin the invasion at 03 45 on Thursday",
+         "2017-06-29 03:45:00", "begin invasion"),
+        ("Begin the invasion at o 800 hours on Thursday",
+         "2017-06-29 08:00:00", "begin invasion"),
+        ("Begin the party at 8 o'clock in the evening on Thursday",
+         "2017-06-29 20:00:00", "begin party"),
+        ("Begin the invasion at 8 in the evening on Thursday",
+         "2017-06-29 20:00:00", "begin invasion"),
+        ("Begin the invasion on Thursday at noon",
+         "2017-06-29 12:00:00", "begin invasion"),
+        ("Begin the invasion on Thursday at midnight",
+         "2017-06-29 00:00:00", "begin invasion"),
+        ("Begin the invasion on Thursday at 0500",
+         "2017-06-29 05:00:00", "begin invasion"),
+        ("remind me to wake up in 4 years",
+         "2021-06-27 00:00:00", "remind me to wake up"),
+        ("remind me to wake up in 4 years and 4 days",
+         "2021-07-01 00:00:00", "remind me to wake up"),
+        ("What is the weather 3 days after tomorrow?",
+         "2017-07-01 00:00:00", "what is weather"),
+        ("december 3",
+         "2017-12-03 00:00:00", ""),
+        ("lets meet at 8:00 tonight",
+         "2017-06-27 20:00:00", "lets meet"),
+        ("lets meet at 5pm",
+         "2017-06-27 17:00:00", "lets meet"),
+        ("lets meet at 8 a.m.",
+         "2017-06-28 08:00:00", "lets meet"),
+        ("remind me to wake up at 8 a.m",
+         "2017-06-28 08:00:00", "remind me to wake up"),
+        ("what is the weather on tuesday",
+         "2017-06-27 00:00:00", "what is weather"),
+        ("what is the weather on monday",
+         "2017-07-03 00:00:00", "what is weather"),
+        ("what is the weather this wednesday",
+         "2017-06-28 00:00:00", "what is weather"),
+        ("on thursday what is the weather",
+         "2017-06-29 00:00:00", "what is weather"),
+        ("on this thursday what is the weather",
+         "2017-06-29 00:00:00", "what is weather"),
+        ("on last monday what was the weather",
+         "2017-06-26 00:00:00", "what was weather"),
+        ("set an alarm for wednesday evening at 8",
+         "2017-06-28 20:00:00", "set alarm"),
+        ("set an alarm for wednesday at 3 o'clock in the afternoon",
+         "2017-06-28 15:00:00", "set alarm"),
+        ("set an alarm for wednesday at 3 o'clock in the morning",
+         "2017-06-28 03:00:00", "set alarm"),
+        ("set an alarm for wednesday morning at 7 o'clock",
+         "2017-06-28 07:00:00", "set alarm"),
+        ("set an alarm for today at 7 o'clock",
+         "2017-06-27 19:00:00", "set alarm"),
+        ("set an alarm for this evening at 7 o'clock",
+         "2017-06-27 19:00:00", "set alarm"),
         # TODO: This test is imperfect due to the "at 7:00" still in the
         #       remainder.  But let it pass for now since time is correct
-        testExtract("set an alarm for this evening at 7:00",
-                    "2017-06-27 19:00:00", "set alarm at 7:00")
-        testExtract("on the evening of june 5th 2017 remind me to" +
-                    " call my mother",
-                    "2017-06-05 19:00:00", "remind me to call my mother")
+        ("set an alarm for this evening at 7:00",
+         "2017-06-27 19:00:00", "set alarm at 7:00"),
+        ("on the evening of june 5th 2017 remind me to" +
+         " call my mother",
+         "2017-06-05 19:00:00", "remind me to call my mother"),
         # TODO: This test is imperfect due to the missing "for" in the
         #       remainder.  But let it pass for now since time is correct
-        testExtract("update my calendar for a morning meeting with julius" +
-                    " on march 4th",
-                    "2018-03-04 08:00:00",
-                    "update my calendar meeting with julius")
-        testExtract("remind me to call mom next tuesday",
-                    "2017-07-04 00:00:00", "remind me to call mom")
-        testExtract("remind me to call mom in 3 weeks",
-                    "2017-07-18 00:00:00", "remind me to call mom")
-        testExtract("remind me to call mom in 8 weeks",
-                    "2017-08-22 00:00:00", "remind me to call mom")
-        testExtract("remind me to call mom in 8 weeks and 2 days",
-                    "2017-08-24 00:00:00", "remind me to call mom")
-        testExtract("remind me to call mom in 4 days",
-                    "2017-07-01 00:00:00", "remind me to call mom")
-        testExtract("remind me to call mom in 3 months",
-                    "2017-09-27 00:00:00", "remind me to call mom")
-        testExtract("remind me to call mom in 2 years and 2 days",
-                    "2019-06-29 00:00:00", "remind me to call mom")
-        testExtract("remind me to call mom next week",
-                    "2017-07-04 00:00:00", "remind me to call mom")
-        testExtract("remind me to call mom at 10am on saturday",
-                    "2017-07-01 10:00:00", "remind me to call mom")
-        testExtract("remind me to call mom at 10am this saturday",
-                    "2017-07-01 10:00:00", "remind me to call mom")
-        testExtract("remind me to call mom at 10 next saturday",
-                    "2017-07-01 10:00:00", "remind me to call mom")
-        testExtract("remind me to call mom at 10am next saturday",
-                    "2017-07-01 10:00:00", "remind me to call mom")
+        ("update my calendar for a morning meeting with julius" +
+         " on march 4th",
+         "2018-03-04 08:00:00",
+         "update my calendar meeting with julius"),
+        ("remind me to call mom next tuesday",
+         "2017-07-04 00:00:00", "remind me to call mom"),
+        ("remind me to call mom in 3 weeks",
+         "2017-07-18 00:00:00", "remind me to call mom"),
+        ("remind me to call mom in 8 weeks",
+         "2017-08-22 00:00:00", "remind me to call mom"),
+        ("remind me to call mom in 4 days",
+         "2017-07-01 00:00:00", "remind me to call mom"),
+        ("remind me to call mom in 3 months",
+         "2017-09-27 00:00:00", "remind me to call mom"),
+        ("remind me to call mom in 2 years and 2 days",
+         "2019-06-29 00:00:00", "remind me to call mom"),
+        ("remind me to call mom next week",
+         "2017-07-04 00:00:00", "remind me to call mom"),
+        ("remind me to call mom at 10am on saturday",
+         "2017-07-01 10:00:00", "remind me to call mom"),
+        ("remind me to call mom at 10am this saturday",
+         "2017-07-01 10:00:00", "remind me to call mom"),
+        ("remind me to call mom at 10 next saturday",
+         "2017-07-01 10:00:00", "remind me to call mom"),
+        ("remind me to call mom at 10am next saturday",
+         "2017-07-01 10:00:00", "remind me to call mom"),
         # test yesterday
-        testExtract("what day was yesterday",
-                    "2017-06-26 00:00:00", "what day was")
-        testExtract("what day was the day before yesterday",
-                    "2017-06-25 00:00:00", "what day was")
-        testExtract("i had dinner yesterday at 6",
-                    "2017-06-26 06:00:00", "i had dinner")
-        testExtract("i had dinner yesterday at 6 am",
-                    "2017-06-26 06:00:00", "i had dinner")
-        testExtract("i had dinner yesterday at 6 pm",
-                    "2017-06-26 18:00:00", "i had dinner")
+        ("what day was yesterday",
+         "2017-06-26 00:00:00", "what day was"),
+        ("what day was the day before yesterday",
+         "2017-06-25 00:00:00", "what day was"),
+        ("i had dinner yesterday at 6",
+         "2017-06-26 06:00:00", "i had dinner"),
+        ("i had dinner yesterday at 6 am",
+         "2017-06-26 06:00:00", "i had dinner"),
+        ("i had dinner yesterday at 6 pm",
+         "2017-06-26 18:00:00", "i had dinner"),
 
         # Below two tests, ensure that time is picked
         # even if no am/pm is specified
         # in case of weekdays/tonight
-        testExtract("set alarm for 9 on weekdays",
-                    "2017-06-27 21:00:00", "set alarm weekdays")
-        testExtract("for 8 tonight",
-                    "2017-06-27 20:00:00", "")
-        testExtract("for 8:30pm tonight",
-                    "2017-06-27 20:30:00", "")
+        ("set alarm for 9 on weekdays",
+         "2017-06-27 21:00:00", "set alarm weekdays"),
+        ("for 8 tonight",
+         "2017-06-27 20:00:00", ""),
+        ("for 8:30pm tonight",
+         "2017-06-27 20:30:00", ""),
         # Tests a time with ':' & without am/pm
-        testExtract("set an alarm for tonight 9:30",
-                    "2017-06-27 21:30:00", "set alarm")
-        testExtract("set an alarm at 9:00 for tonight",
-                    "2017-06-27 21:00:00", "set alarm")
+        ("set an alarm for tonight 9:30",
+         "2017-06-27 21:30:00", "set alarm"),
+        ("set an alarm at 9:00 for tonight",
+         "2017-06-27 21:00:00", "set alarm"),
         # Check if it picks the intent irrespective of correctness
-        testExtract("set an alarm at 9 o'clock for tonight",
-                    "2017-06-27 21:00:00", "set alarm")
-        testExtract("remind me about the game tonight at 11:30",
-                    "2017-06-27 23:30:00", "remind me about game")
-        testExtract("set alarm at 7:30 on weekdays",
-                    "2017-06-27 19:30:00", "set alarm on weekdays")
+        ("set an alarm at 9 o'clock for tonight",
+         "2017-06-27 21:00:00", "set alarm"),
+        ("remind me about the game tonight at 11:30",
+         "2017-06-27 23:30:00", "remind me about game"),
+        ("set alarm at 7:30 on weekdays",
+         "2017-06-27 19:30:00", "set alarm on weekdays"),
 
         #  "# days <from X/after X>"
-        testExtract("my birthday is 2 days from today",
-                    "2017-06-29 00:00:00", "my birthday is")
-        testExtract("my birthday is 2 days after today",
-                    "2017-06-29 00:00:00", "my birthday is")
-        testExtract("my birthday is 2 days from tomorrow",
-                    "2017-06-30 00:00:00", "my birthday is")
-        testExtract("my birthday is 2 days after tomorrow",
-                    "2017-06-30 00:00:00", "my birthday is")
-        testExtract("remind me to call mom at 10am 2 days after next saturday",
-                    "2017-07-10 10:00:00", "remind me to call mom")
-        testExtract("my birthday is 2 days from yesterday",
-                    "2017-06-28 00:00:00", "my birthday is")
-        testExtract("my birthday is 2 days after yesterday",
-                    "2017-06-28 00:00:00", "my birthday is")
+        ("my birthday is 2 days from today",
+         "2017-06-29 00:00:00", "my birthday is"),
+        ("my birthday is 2 days after today",
+         "2017-06-29 00:00:00", "my birthday is"),
+        ("my birthday is 2 days from tomorrow",
+         "2017-06-30 00:00:00", "my birthday is"),
+        ("my birthday is 2 days after tomorrow",
+         "2017-06-30 00:00:00", "my birthday is"),
+        ("remind me to call mom at 10am 2 days after next saturday",
+         "2017-07-10 10:00:00", "remind me to call mom"),
+        ("my birthday is 2 days from yesterday",
+         "2017-06-28 00:00:00", "my birthday is"),
+        ("my birthday is 2 days after yesterday",
+         "2017-06-28 00:00:00", "my birthday is"),
 
         #  "# days ago>"
-        testExtract("my birthday was 1 day ago",
-                    "2017-06-26 00:00:00", "my birthday was")
-        testExtract("my birthday was 2 days ago",
-                    "2017-06-25 00:00:00", "my birthday was")
-        testExtract("my birthday was 3 days ago",
-                    "2017-06-24 00:00:00", "my birthday was")
-        testExtract("my birthday was 4 days ago",
-                    "2017-06-23 00:00:00", "my birthday was")
+        ("my birthday was 1 day ago",
+         "2017-06-26 00:00:00", "my birthday was"),
+        ("my birthday was 2 days ago",
+         "2017-06-25 00:00:00", "my birthday was"),
+        ("my birthday was 3 days ago",
+         "2017-06-24 00:00:00", "my birthday was"),
+        ("my birthday was 4 days ago",
+         "2017-06-23 00:00:00", "my birthday was"),
         # TODO this test is imperfect due to "tonight" in the reminder, but let is pass since the date is correct
-        testExtract("lets meet tonight",
-                    "2017-06-27 22:00:00", "lets meet tonight")
+        ("lets meet tonight",
+         "2017-06-27 22:00:00", "lets meet tonight"),
         # TODO this test is imperfect due to "at night" in the reminder, but let is pass since the date is correct
-        testExtract("lets meet later at night",
-                    "2017-06-27 22:00:00", "lets meet later at night")
+        ("lets meet later at night",
+         "2017-06-27 22:00:00", "lets meet later at night"),
         # TODO this test is imperfect due to "night" in the reminder, but let is pass since the date is correct
-        testExtract("what's the weather like tomorrow night",
-                    "2017-06-28 22:00:00", "what is weather like night")
+        ("what's the weather like tomorrow night",
+         "2017-06-28 22:00:00", "what is weather like night"),
         # TODO this test is imperfect due to "night" in the reminder, but let is pass since the date is correct
-        testExtract("what's the weather like next tuesday night",
-                    "2017-07-04 22:00:00", "what is weather like night")
+        ("what's the weather like next tuesday night",
+         "2017-07-04 22:00:00", "what is weather like night"),
+    )
+
+    def test_extractdatetime_en(self):
+        date = ANCHOR_DATE
+        # compared in one go, each entry carries its text so the first
+        # differing element in a failure shows which case broke
+        actual = []
+        expected = []
+        for text, normalized, expected_date, expected_leftover in \
+                self.NORMALIZED_DATETIME_CASES:
+            extracted_date, leftover = extract_datetime(normalized, date)
+            actual.append((text, format_datetime(extracted_date), leftover))
+            expected.append((text, expected_date, expected_leftover))
+        self.assertListEqual(actual, expected)
+
+    def test_extract_datetime_batch(self):
+        texts = [normalized for _, normalized, _, _ in
+                 self.NORMALIZED_DATETIME_CASES[:8]] + ["feed the fish"]
+        expected = [extract_datetime(text, ANCHOR_DATE) for text in texts]
+        # small enough to be parsed in the calling process
+        self.assertEqual(extract_datetime_batch(texts, ANCHOR_DATE,
+                                                workers=2), expected)
+        with patch.object(lingua_franca.parse, "_BATCH_MIN_PER_WORKER", 2):
+            self.assertEqual(extract_datetime_batch(texts, ANCHOR_DATE,
+                                                    workers=2), expected)
+        self.assertEqual(extract_datetime_batch(texts, ANCHOR_DATE,
+                                                workers=1), expected)
+        self.assertEqual(extract_datetime_batch([]), [])
 
     def test_extract_ambiguous_time_en(self):
         morning = datetime(2017, 6, 27, 8, 1, 2, tzinfo=default_timezone())
@@ -771,10 +924,11 @@ class TestNormalize(unittest.TestCase):
                              local_dt.tzinfo))
 
     def test_extract_relativedatetime_en(self):
+        date = RELATIVE_ANCHOR_DATE
+
         def extractWithFormat(text):
-            date = datetime(2017, 6, 27, 10, 1, 2, tzinfo=default_timezone())
             [extractedDate, leftover] = extract_datetime(text, date)
-            extractedDate = extractedDate.strftime("%Y-%m-%d %H:%M:%S")
+            extractedDate = format_datetime(extractedDate)
             return [extractedDate, leftover]
 
         def testExtract(text, expected_date, expected_leftover):
@@ -925,164 +1079,183 @@ class TestNormalize(unittest.TestCase):
                                          short_scale=True), [2, 6e12])
         self.assertEqual(extract_numbers("two pigs and six trillion bacteria",
                                          short_scale=False), [2, 6e18])
+        self.assertEqual(extract_numbers("two hundred and five",
+                                         short_scale=None), [200.0, 5.0])
         self.assertEqual(extract_numbers("thirty second or first",
                                          ordinals=True), [32, 1])
         self.assertEqual(extract_numbers("this is a seven eight nine and a"
                                          " half test"),
                          [7.0, 8.0, 9.5])
 
-    def test_contractions(self):
-        self.assertEqual(normalize("ain't"), "is not")
-        self.assertEqual(normalize("aren't"), "are not")
-        self.assertEqual(normalize("can't"), "can not")
-        self.assertEqual(normalize("could've"), "could have")
-        self.assertEqual(normalize("couldn't"), "could not")
-        self.assertEqual(normalize("didn't"), "did not")
-        self.assertEqual(normalize("doesn't"), "does not")
-        self.assertEqual(normalize("don't"), "do not")
-        self.assertEqual(normalize("gonna"), "going to")
-        self.assertEqual(normalize("gotta"), "got to")
-        self.assertEqual(normalize("hadn't"), "had not")
-        self.assertEqual(normalize("hadn't have"), "had not have")
-        self.assertEqual(normalize("hasn't"), "has not")
-        self.assertEqual(normalize("haven't"), "have not")
+    def test_extract_numbers_batch(self):
+        texts = ["two beers for two bears", "twenty 2", "no numbers",
+                 "twenty 2"]
+        results = extract_numbers_batch(texts)
+        self.assertEqual(results, [[2.0, 2.0], [22.0], [], [22.0]])
+        self.assertIsNot(results[1], results[3])
+        self.assertEqual(extract_numbers_batch(["third one"], ordinals=True),
+                         [[3]])
+        self.assertEqual(extract_numbers_batch([]), [])
+
+    CONTRACTION_CASES = (
+        ("ain't", "is not"),
+        ("aren't", "are not"),
+        ("can't", "can not"),
+        ("could've", "could have"),
+        ("couldn't", "could not"),
+        ("didn't", "did not"),
+        ("doesn't", "does not"),
+        ("don't", "do not"),
+        ("gonna", "going to"),
+        ("gotta", "got to"),
+        ("hadn't", "had not"),
+        ("hadn't have", "had not have"),
+        ("hasn't", "has not"),
+        ("haven't", "have not"),
         # TODO: Ambiguous with "he had"
-        self.assertEqual(normalize("he'd"), "he would")
-        self.assertEqual(normalize("he'll"), "he will")
+        ("he'd", "he would"),
+        ("he'll", "he will"),
         # TODO: Ambiguous with "he has"
-        self.assertEqual(normalize("he's"), "he is")
+        ("he's", "he is"),
         # TODO: Ambiguous with "how would"
-        self.assertEqual(normalize("how'd"), "how did")
-        self.assertEqual(normalize("how'll"), "how will")
+        ("how'd", "how did"),
+        ("how'll", "how will"),
         # TODO: Ambiguous with "how has" and "how does"
-        self.assertEqual(normalize("how's"), "how is")
+        ("how's", "how is"),
         # TODO: Ambiguous with "I had"
-        self.assertEqual(normalize("I'd"), "I would")
-        self.assertEqual(normalize("I'll"), "I will")
-        self.assertEqual(normalize("I'm"), "I am")
-        self.assertEqual(normalize("I've"), "I have")
-        self.assertEqual(normalize("I haven't"), "I have not")
-        self.assertEqual(normalize("isn't"), "is not")
-        self.assertEqual(normalize("it'd"), "it would")
-        self.assertEqual(normalize("it'll"), "it will")
+        ("I'd", "I would"),
+        ("I'll", "I will"),
+        ("I'm", "I am"),
+        ("I've", "I have"),
+        ("I haven't", "I have not"),
+        ("isn't", "is not"),
+        ("it'd", "it would"),
+        ("it'll", "it will"),
         # TODO: Ambiguous with "it has"
-        self.assertEqual(normalize("it's"), "it is")
-        self.assertEqual(normalize("it isn't"), "it is not")
-        self.assertEqual(normalize("mightn't"), "might not")
-        self.assertEqual(normalize("might've"), "might have")
-        self.assertEqual(normalize("mustn't"), "must not")
-        self.assertEqual(normalize("mustn't have"), "must not have")
-        self.assertEqual(normalize("must've"), "must have")
-        self.assertEqual(normalize("needn't"), "need not")
-        self.assertEqual(normalize("oughtn't"), "ought not")
-        self.assertEqual(normalize("shan't"), "shall not")
+        ("it's", "it is"),
+        ("it isn't", "it is not"),
+        ("mightn't", "might not"),
+        ("might've", "might have"),
+        ("mustn't", "must not"),
+        ("mustn't have", "must not have"),
+        ("must've", "must have"),
+        ("needn't", "need not"),
+        ("oughtn't", "ought not"),
+        ("shan't", "shall not"),
         # TODO: Ambiguous wiht "she had"
-        self.assertEqual(normalize("she'd"), "she would")
-        self.assertEqual(normalize("she hadn't"), "she had not")
-        self.assertEqual(normalize("she'll"), "she will")
-        self.assertEqual(normalize("she's"), "she is")
-        self.assertEqual(normalize("she isn't"), "she is not")
-        self.assertEqual(normalize("should've"), "should have")
-        self.assertEqual(normalize("shouldn't"), "should not")
-        self.assertEqual(normalize("shouldn't have"), "should not have")
-        self.assertEqual(normalize("somebody's"), "somebody is")
+        ("she'd", "she would"),
+        ("she hadn't", "she had not"),
+        ("she'll", "she will"),
+        ("she's", "she is"),
+        ("she isn't", "she is not"),
+        ("should've", "should have"),
+        ("shouldn't", "should not"),
+        ("shouldn't have", "should not have"),
+        ("somebody's", "somebody is"),
         # TODO: Ambiguous with "someone had"
-        self.assertEqual(normalize("someone'd"), "someone would")
-        self.assertEqual(normalize("someone hadn't"), "someone had not")
-        self.assertEqual(normalize("someone'll"), "someone will")
+        ("someone'd", "someone would"),
+        ("someone hadn't", "someone had not"),
+        ("someone'll", "someone will"),
         # TODO: Ambiguous with "someone has"
-        self.assertEqual(normalize("someone's"), "someone is")
-        self.assertEqual(normalize("that'll"), "that will")
+        ("someone's", "someone is"),
+        ("that'll", "that will"),
         # TODO: Ambiguous with "that has"
-        self.assertEqual(normalize("that's"), "that is")
+        ("that's", "that is"),
         # TODO: Ambiguous with "that had"
-        self.assertEqual(normalize("that'd"), "that would")
+        ("that'd", "that would"),
         # TODO: Ambiguous with "there had"
-        self.assertEqual(normalize("there'd"), "there would")
-        self.assertEqual(normalize("there're"), "there are")
+        ("there'd", "there would"),
+        ("there're", "there are"),
         # TODO: Ambiguous with "there has"
-        self.assertEqual(normalize("there's"), "there is")
+        ("there's", "there is"),
         # TODO: Ambiguous with "they had"
-        self.assertEqual(normalize("they'd"), "they would")
-        self.assertEqual(normalize("they'll"), "they will")
-        self.assertEqual(normalize("they won't have"), "they will not have")
-        self.assertEqual(normalize("they're"), "they are")
-        self.assertEqual(normalize("they've"), "they have")
-        self.assertEqual(normalize("they haven't"), "they have not")
-        self.assertEqual(normalize("wasn't"), "was not")
+        ("they'd", "they would"),
+        ("they'll", "they will"),
+        ("they won't have", "they will not have"),
+        ("they're", "they are"),
+        ("they've", "they have"),
+        ("they haven't", "they have not"),
+        ("wasn't", "was not"),
         # TODO: Ambiguous wiht "we had"
-        self.assertEqual(normalize("we'd"), "we would")
-        self.assertEqual(normalize("we would've"), "we would have")
-        self.assertEqual(normalize("we wouldn't"), "we would not")
-        self.assertEqual(normalize("we wouldn't have"), "we would not have")
-        self.assertEqual(normalize("we'll"), "we will")
-        self.assertEqual(normalize("we won't have"), "we will not have")
-        self.assertEqual(normalize("we're"), "we are")
-        self.assertEqual(normalize("we've"), "we have")
-        self.assertEqual(normalize("weren't"), "were not")
-        self.assertEqual(normalize("what'd"), "what did")
-        self.assertEqual(normalize("what'll"), "what will")
-        self.assertEqual(normalize("what're"), "what are")
+        ("we'd", "we would"),
+        ("we would've", "we would have"),
+        ("we wouldn't", "we would not"),
+        ("we wouldn't have", "we would not have"),
+        ("we'll", "we will"),
+        ("we won't have", "we will not have"),
+        ("we're", "we are"),
+        ("we've", "we have"),
+        ("weren't", "were not"),
+        ("what'd", "what did"),
+        ("what'll", "what will"),
+        ("what're", "what are"),
         # TODO: Ambiguous with "what has" / "what does")
-        self.assertEqual(normalize("whats"), "what is")
-        self.assertEqual(normalize("what's"), "what is")
-        self.assertEqual(normalize("what've"), "what have")
+        ("whats", "what is"),
+        ("what's", "what is"),
+        ("what've", "what have"),
         # TODO: Ambiguous with "when has"
-        self.assertEqual(normalize("when's"), "when is")
-        self.assertEqual(normalize("where'd"), "where did")
+        ("when's", "when is"),
+        ("where'd", "where did"),
         # TODO: Ambiguous with "where has" / where does"
-        self.assertEqual(normalize("where's"), "where is")
-        self.assertEqual(normalize("where've"), "where have")
+        ("where's", "where is"),
+        ("where've", "where have"),
         # TODO: Ambiguous with "who had" "who did")
-        self.assertEqual(normalize("who'd"), "who would")
-        self.assertEqual(normalize("who'd've"), "who would have")
-        self.assertEqual(normalize("who'll"), "who will")
-        self.assertEqual(normalize("who're"), "who are")
+        ("who'd", "who would"),
+        ("who'd've", "who would have"),
+        ("who'll", "who will"),
+        ("who're", "who are"),
         # TODO: Ambiguous with "who has" / "who does"
-        self.assertEqual(normalize("who's"), "who is")
-        self.assertEqual(normalize("who've"), "who have")
-        self.assertEqual(normalize("why'd"), "why did")
-        self.assertEqual(normalize("why're"), "why are")
+        ("who's", "who is"),
+        ("who've", "who have"),
+        ("why'd", "why did"),
+        ("why're", "why are"),
         # TODO: Ambiguous with "why has" / "why does"
-        self.assertEqual(normalize("why's"), "why is")
-        self.assertEqual(normalize("won't"), "will not")
-        self.assertEqual(normalize("won't've"), "will not have")
-        self.assertEqual(normalize("would've"), "would have")
-        self.assertEqual(normalize("wouldn't"), "would not")
-        self.assertEqual(normalize("wouldn't've"), "would not have")
-        self.assertEqual(normalize("ya'll"), "you all")
-        self.assertEqual(normalize("y'all"), "you all")
-        self.assertEqual(normalize("y'ain't"), "you are not")
+        ("why's", "why is"),
+        ("won't", "will not"),
+        ("won't've", "will not have"),
+        ("would've", "would have"),
+        ("wouldn't", "would not"),
+        ("wouldn't've", "would not have"),
+        ("ya'll", "you all"),
+        ("y'all", "you all"),
+        ("y'ain't", "you are not"),
         # TODO: Ambiguous with "you had"
-        self.assertEqual(normalize("you'd"), "you would")
-        self.assertEqual(normalize("you'd've"), "you would have")
-        self.assertEqual(normalize("you'll"), "you will")
-        self.assertEqual(normalize("you're"), "you are")
-        self.assertEqual(normalize("you aren't"), "you are not")
-        self.assertEqual(normalize("you've"), "you have")
-        self.assertEqual(normalize("you haven't"), "you have not")
+        ("you'd", "you would"),
+        ("you'd've", "you would have"),
+        ("you'll", "you will"),
+        ("you're", "you are"),
+        ("you aren't", "you are not"),
+        ("you've", "you have"),
+        ("you haven't", "you have not"),
+    )
+
+    def test_contractions(self):
+        for text, expected in self.CONTRACTION_CASES:
+            with self.subTest(text=text):
+                self.assertEqual(normalize(text), expected)
+
+    COMBINATION_CASES = (
+        ("I couldn't have guessed there'd be two",
+         "I could not have guessed there would be 2"),
+        ("I wouldn't have", "I would not have"),
+        ("I hadn't been there", "I had not been there"),
+        ("I would've", "I would have"),
+        ("it hadn't", "it had not"),
+        ("it hadn't have", "it had not have"),
+        ("it would've", "it would have"),
+        ("she wouldn't have", "she would not have"),
+        ("she would've", "she would have"),
+        ("someone wouldn't have", "someone would not have"),
+        ("someone would've", "someone would have"),
+        ("what's the weather like", "what is weather like"),
+        ("that's what I told you", "that is what I told you"),
+        ("whats 8 + 4", "what is 8 + 4"),
+    )
 
     def test_combinations(self):
-        self.assertEqual(normalize("I couldn't have guessed there'd be two"),
-                         "I could not have guessed there would be 2")
-        self.assertEqual(normalize("I wouldn't have"), "I would not have")
-        self.assertEqual(normalize("I hadn't been there"),
-                         "I had not been there")
-        self.assertEqual(normalize("I would've"), "I would have")
-        self.assertEqual(normalize("it hadn't"), "it had not")
-        self.assertEqual(normalize("it hadn't have"), "it had not have")
-        self.assertEqual(normalize("it would've"), "it would have")
-        self.assertEqual(normalize("she wouldn't have"), "she would not have")
-        self.assertEqual(normalize("she would've"), "she would have")
-        self.assertEqual(normalize("someone wouldn't have"),
-                         "someone would not have")
-        self.assertEqual(normalize("someone would've"), "someone would have")
-        self.assertEqual(normalize("what's the weather like"),
-                         "what is weather like")
-        self.assertEqual(normalize("that's what I told you"),
-                         "that is what I told you")
-
-        self.assertEqual(normalize("whats 8 + 4"), "what is 8 + 4")
+        for text, expected in self.COMBINATION_CASES:
+            with self.subTest(text=text):
+                self.assertEqual(normalize(text), expected)
 
     # TODO not localized; needed in english?
     def test_gender(self):
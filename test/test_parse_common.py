@@ -15,7 +15,7 @@
 
 import unittest
 
-from lingua_franca.lang.parse_common import tokenize, Token
+from lingua_franca.lang.parse_common import tokenize, Token, Normalizer
 
 
 class TestParseCommon(unittest.TestCase):
@@ -33,3 +33,28 @@ class TestParseCommon(unittest.TestCase):
 
         self.assertEqual(tokenize('hashtag #1world'),
                          [Token('hashtag', 0), Token('#1world', 1)])
+
+    def test_remove_symbols_and_accents(self):
+        normalizer = Normalizer({"remove_symbols": True,
+                                 "remove_accents": True})
+        self.assertEqual(normalizer.normalize("Olá (ÉCOLE)! *où*"),
+                         "Ola ECOLE ou")
+        # multi-character keys can't go through str.translate
+        normalizer = Normalizer({"remove_symbols": True,
+                                 "symbols": ["--", ";"]})
+        self.assertEqual(normalizer.normalize("one--two;three"),
+                         "one two three")
+
+    def test_map_words(self):
+        normalizer = Normalizer({
+            "contractions": {"it's": "it is", "gimme": "give me"},
+            "number_replacements": {"one": "1", "two": "2"},
+            "word_replacements": {"me": "to me"}})
+        for utterance in ("gimme one", "it's two   #1", "", "gimme gimme"):
+            with self.subTest(utterance=utterance):
+                stepwise = normalizer.replace_words(
+                    normalizer.numbers_to_digits(
+                        normalizer.expand_contractions(utterance)))
+                self.assertEqual(normalizer.map_words(utterance), stepwise)
+        self.assertEqual(normalizer.map_words("gimme one"),
+                         "give to me 1")
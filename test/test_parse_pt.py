@@ -280,6 +280,14 @@ class TestExtractGender(unittest.TestCase):
         self.assertEqual(get_gender("ponte", "essa ponte caiu",
                                     lang="pt"), "f")
 
+    def test_gender_memoized_pt(self):
+        get_gender.cache_clear()
+        self.assertEqual(get_gender("boi", lang="pt"), None)
+        self.assertEqual(get_gender("boi", "", "pt"), None)
+        # the context is part of the key
+        self.assertEqual(get_gender("boi", "o boi come erva", lang="pt"), "m")
+        self.assertEqual(get_gender.cache_info().currsize, 2)
+
 
 if __name__ == "__main__":
     unittest.main()